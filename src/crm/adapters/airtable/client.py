@@ -1,40 +1,150 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://api.airtable.com"
+MAX_RECORDS_PER_REQUEST = 10
+MAX_CONCURRENT_REQUESTS = 5
+# Airtable allows 5 requests per second per base and locks clients out for 30s past that.
+MAX_REQUESTS_PER_SECOND = 5.0
+TABLES_CACHE_TTL_SECONDS = 300.0
+# For callers that opt into the GET response cache; writes through the client clear it.
+RESPONSE_CACHE_TTL_SECONDS = 30.0
+# Keeps OR({ExternalId}=...) formulas well under Airtable's URL length limit.
+MAX_IDS_PER_FORMULA = 50
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# PATCH is safe to replay here: record updates target ids and upserts merge on ExternalId.
+RETRY_METHODS = frozenset({"GET", "PATCH"})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AirtableRecord:
     record_id: str
     fields: dict[str, Any]
 
 
+# (tables by id, tables by name)
+TablesIndex = tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]
+
+
+def index_tables(tables: list[dict[str, Any]]) -> TablesIndex:
+    return (
+        {table["id"]: table for table in tables},
+        {table["name"]: table for table in tables},
+    )
+
+
 class AirtableError(RuntimeError):
-    def __init__(self, message: str, status_code: int | None = None) -> None:
+    def __init__(
+        self, message: str, status_code: int | None = None, error_type: str | None = None
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.error_type = error_type
 
 
 class AirtableClient:
-    def __init__(self, api_key: str, base_id: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        response_cache_ttl: float = 0.0,
+        max_requests_per_second: float = MAX_REQUESTS_PER_SECOND,
+        metadata_cache_dir: Path | None = None,
+    ) -> None:
         self.base_id = base_id
+        self._metadata_cache_path = (
+            metadata_cache_dir / f"airtable_meta_{base_id}.json" if metadata_cache_dir else None
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._min_interval = 1.0 / max_requests_per_second if max_requests_per_second > 0 else 0.0
+        self._next_request_at = 0.0
+        self._pace_lock = threading.Lock()
+        self._tables_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._fields_index: tuple[list[dict[str, Any]], dict[str, dict[str, Any]]] | None = None
+        self._tables_index: tuple[list[dict[str, Any]], TablesIndex] | None = None
+        self._response_cache_ttl = response_cache_ttl
+        self._responses: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._responses_lock = threading.Lock()
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=RETRY_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
         )
 
     def list_tables(self) -> list[dict[str, Any]]:
-        data = self._request("GET", f"/v0/meta/bases/{self.base_id}/tables")
-        return data.get("tables", [])
+        if self._tables_cache is not None:
+            fetched_at, tables = self._tables_cache
+            if time.monotonic() - fetched_at < TABLES_CACHE_TTL_SECONDS:
+                return tables
+        tables = self._fetch_tables()
+        self._tables_cache = (time.monotonic(), tables)
+        return tables
+
+    def _fetch_tables(self) -> list[dict[str, Any]]:
+        path = f"/v0/meta/bases/{self.base_id}/tables"
+        if self._metadata_cache_path is None:
+            return self._request("GET", path).get("tables", [])
+        cached = _read_metadata_cache(self._metadata_cache_path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._send_response("GET", path, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        tables = response.json().get("tables", [])
+        etag = response.headers.get("ETag")
+        if etag:
+            _write_metadata_cache(self._metadata_cache_path, etag, tables)
+        return tables
+
+    def fields_by_table(self) -> dict[str, dict[str, Any]]:
+        tables = self.list_tables()
+        if self._fields_index is None or self._fields_index[0] is not tables:
+            index = {
+                table["id"]: {field["name"]: field for field in table.get("fields", [])}
+                for table in tables
+            }
+            self._fields_index = (tables, index)
+        return self._fields_index[1]
+
+    def tables_index(self) -> TablesIndex:
+        tables = self.list_tables()
+        if self._tables_index is None or self._tables_index[0] is not tables:
+            self._tables_index = (tables, index_tables(tables))
+        return self._tables_index[1]
+
+    def invalidate_tables_cache(self) -> None:
+        self._tables_cache = None
 
     def create_table(self, name: str, fields: list[dict[str, Any]]) -> dict[str, Any]:
         payload = {"name": name, "fields": fields}
-        return self._request("POST", f"/v0/meta/bases/{self.base_id}/tables", json=payload)
+        created = self._request("POST", f"/v0/meta/bases/{self.base_id}/tables", json=payload)
+        self.invalidate_tables_cache()
+        return created
 
     def create_field(
         self,
@@ -46,9 +156,11 @@ class AirtableClient:
         payload: dict[str, Any] = {"name": name, "type": field_type}
         if options:
             payload["options"] = options
-        return self._request(
+        created = self._request(
             "POST", f"/v0/meta/bases/{self.base_id}/tables/{table_id}/fields", json=payload
         )
+        self.invalidate_tables_cache()
+        return created
 
     def update_field(
         self,
@@ -59,11 +171,13 @@ class AirtableClient:
         payload: dict[str, Any] = {}
         if options:
             payload["options"] = options
-        return self._request(
+        updated = self._request(
             "PATCH",
             f"/v0/meta/bases/{self.base_id}/tables/{table_id}/fields/{field_id}",
             json=payload,
         )
+        self.invalidate_tables_cache()
+        return updated
 
     def list_records(
         self,
@@ -71,26 +185,41 @@ class AirtableClient:
         fields: list[str] | None = None,
         filter_formula: str | None = None,
     ) -> list[AirtableRecord]:
+        return list(self.iter_records(table_id, fields=fields, filter_formula=filter_formula))
+
+    def iter_records(
+        self,
+        table_id: str,
+        fields: list[str] | None = None,
+        filter_formula: str | None = None,
+    ) -> Iterator[AirtableRecord]:
+        for page in self.iter_record_pages(table_id, fields=fields, filter_formula=filter_formula):
+            yield from page
+
+    def iter_record_pages(
+        self,
+        table_id: str,
+        fields: list[str] | None = None,
+        filter_formula: str | None = None,
+    ) -> Iterator[list[AirtableRecord]]:
         params: dict[str, Any] = {}
         if fields:
             params["fields[]"] = fields
         if filter_formula:
             params["filterByFormula"] = filter_formula
 
-        records: list[AirtableRecord] = []
         offset = None
         while True:
             if offset:
                 params["offset"] = offset
             data = self._request("GET", f"/v0/{self.base_id}/{table_id}", params=params)
-            for record in data.get("records", []):
-                records.append(
-                    AirtableRecord(record_id=record["id"], fields=record.get("fields", {}))
-                )
+            yield [
+                AirtableRecord(record_id=record["id"], fields=record.get("fields", {}))
+                for record in data.get("records", [])
+            ]
             offset = data.get("offset")
             if not offset:
                 break
-        return records
 
     def create_record(self, table_id: str, fields: dict[str, Any]) -> AirtableRecord:
         data = self._request("POST", f"/v0/{self.base_id}/{table_id}", json={"fields": fields})
@@ -106,8 +235,39 @@ class AirtableClient:
         )
         return AirtableRecord(record_id=data["id"], fields=data.get("fields", {}))
 
+    def update_records(self, table_id: str, records: list[AirtableRecord]) -> list[AirtableRecord]:
+        updated: list[AirtableRecord] = []
+        for start in range(0, len(records), MAX_RECORDS_PER_REQUEST):
+            chunk = records[start : start + MAX_RECORDS_PER_REQUEST]
+            payload = {
+                "records": [{"id": record.record_id, "fields": record.fields} for record in chunk]
+            }
+            data = self._request("PATCH", f"/v0/{self.base_id}/{table_id}", json=payload)
+            for record in data.get("records", []):
+                updated.append(
+                    AirtableRecord(record_id=record["id"], fields=record.get("fields", {}))
+                )
+        return updated
+
+    def upsert_records(
+        self, table_id: str, records: list[dict[str, Any]], merge_on: list[str]
+    ) -> list[AirtableRecord]:
+        upserted: list[AirtableRecord] = []
+        for start in range(0, len(records), MAX_RECORDS_PER_REQUEST):
+            chunk = records[start : start + MAX_RECORDS_PER_REQUEST]
+            payload = {
+                "performUpsert": {"fieldsToMergeOn": merge_on},
+                "records": [{"fields": fields} for fields in chunk],
+            }
+            data = self._request("PATCH", f"/v0/{self.base_id}/{table_id}", json=payload)
+            for record in data.get("records", []):
+                upserted.append(
+                    AirtableRecord(record_id=record["id"], fields=record.get("fields", {}))
+                )
+        return upserted
+
     def find_record_by_external_id(self, table_id: str, external_id: str) -> AirtableRecord | None:
-        formula = f"{{ExternalId}}='{external_id.replace("'", "\\'")}'"
+        formula = _external_id_formula(external_id)
         records = self.list_records(table_id, filter_formula=formula)
         if not records:
             return None
@@ -115,14 +275,118 @@ class AirtableClient:
             raise AirtableError("Multiple Airtable records found for ExternalId.")
         return records[0]
 
+    def find_records_by_external_ids(
+        self, table_id: str, external_ids: list[str]
+    ) -> dict[str, AirtableRecord]:
+        found: dict[str, AirtableRecord] = {}
+        for start in range(0, len(external_ids), MAX_IDS_PER_FORMULA):
+            chunk = external_ids[start : start + MAX_IDS_PER_FORMULA]
+            formula = "OR(" + ",".join(_external_id_formula(value) for value in chunk) + ")"
+            for record in self.iter_records(
+                table_id, fields=["ExternalId"], filter_formula=formula
+            ):
+                external_id = record.fields.get("ExternalId")
+                if external_id in found:
+                    raise AirtableError(
+                        f"Multiple Airtable records found for ExternalId {external_id}."
+                    )
+                found[external_id] = record
+        return found
+
     def _request(
         self, method: str, path: str, params: dict[str, Any] | None = None, json: Any | None = None
     ):
+        if self._response_cache_ttl <= 0:
+            return self._send(method, path, params=params, json=json)
+        if method != "GET":
+            data = self._send(method, path, params=params, json=json)
+            with self._responses_lock:
+                self._responses.clear()
+            return data
+
+        key = (path, repr(sorted((params or {}).items())))
+        with self._responses_lock:
+            cached = self._responses.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._response_cache_ttl:
+            return cached[1]
+        data = self._send(method, path, params=params)
+        with self._responses_lock:
+            self._responses[key] = (time.monotonic(), data)
+        return data
+
+    def _pace(self) -> None:
+        # Hand out evenly spaced start times so parallel table pushes share the base's quota.
+        with self._pace_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self._min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _send(
+        self, method: str, path: str, params: dict[str, Any] | None = None, json: Any | None = None
+    ):
+        return self._send_response(method, path, params=params, json=json).json()
+
+    def _send_response(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
         url = f"{BASE_URL}{path}"
-        response = self.session.request(method, url, params=params, json=json, timeout=30)
+        self._pace()
+        with self._slots:
+            response = self.session.request(
+                method, url, params=params, json=json, headers=headers, timeout=30
+            )
         if response.status_code >= 400:
             raise AirtableError(
                 f"Airtable error {response.status_code}: {response.text}",
                 status_code=response.status_code,
+                error_type=_error_type(response),
             )
-        return response.json()
+        return response
+
+
+def _error_type(response: requests.Response) -> str | None:
+    # Airtable error bodies look like {"error": {"type": "UNKNOWN_FIELD_NAME", "message": ...}}.
+    try:
+        error = response.json().get("error")
+    except (ValueError, AttributeError):
+        return None
+    return error.get("type") if isinstance(error, dict) else None
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "leadops"
+
+
+def _read_metadata_cache(path: Path) -> tuple[str, list[dict[str, Any]]] | None:
+    try:
+        cached = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    etag, tables = cached.get("etag"), cached.get("tables")
+    if not isinstance(etag, str) or not isinstance(tables, list):
+        return None
+    return etag, tables
+
+
+def _write_metadata_cache(path: Path, etag: str, tables: list[dict[str, Any]]) -> None:
+    # Best effort: a missing or unwritable cache only costs a full fetch next time.
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(json.dumps({"etag": etag, "tables": tables}).encode("utf-8"))
+
+
+_FORMULA_ESCAPES = str.maketrans({"'": "\\'"})
+
+
+def _external_id_formula(external_id: str) -> str:
+    return f"{{ExternalId}}='{external_id.translate(_FORMULA_ESCAPES)}'"
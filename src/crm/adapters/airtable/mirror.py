@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import queue
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Protocol
-
-import yaml
-
-from crm.adapters.airtable.client import AirtableClient, AirtableError
-from crm.store.migrations import Schema
-from crm.store.sqlite import SqliteStore
+from threading import Event
+from typing import Any
+
+from crm.adapters.airtable.client import (
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RECORDS_PER_REQUEST,
+    AirtableClient,
+    AirtableError,
+    AirtableRecord,
+    TablesIndex,
+    index_tables,
+)
+from crm.services.utils import utc_now_iso
+from crm.store.migrations import Schema, read_yaml
+from crm.store.sqlite import SqliteSession, SqliteStore, quote_identifier
 
 MIRROR_FIELD_NAMES = {"ExternalId", "MirrorVersion", "MirrorUpdatedAt"}
 MODIFIED_TIME_FIELD = "AirtableModifiedAt"
@@ -37,45 +48,50 @@ TYPE_MAP = {
     "bool": "checkbox",
 }
 
-COMPATIBLE_TYPES = {
-    "singleLineText": {
-        "singleLineText",
-        "multilineText",
-        "richText",
-        "singleSelect",
-        "multipleSelects",
-    },
-    "multilineText": {"multilineText", "singleLineText", "richText"},
-    "number": {"number", "currency", "percent"},
-    "date": {"date", "dateTime"},
-    "dateTime": {"dateTime"},
-    "checkbox": {"checkbox"},
-    "lastModifiedTime": {"lastModifiedTime"},
+COMPATIBLE_TYPES: dict[str, frozenset[str]] = {
+    "singleLineText": frozenset(
+        {"singleLineText", "multilineText", "richText", "singleSelect", "multipleSelects"}
+    ),
+    "multilineText": frozenset({"multilineText", "singleLineText", "richText"}),
+    "number": frozenset({"number", "currency", "percent"}),
+    "date": frozenset({"date", "dateTime"}),
+    "dateTime": frozenset({"dateTime"}),
+    "checkbox": frozenset({"checkbox"}),
+    "lastModifiedTime": frozenset({"lastModifiedTime"}),
 }
+_NO_COMPATIBLE_TYPES: frozenset[str] = frozenset()
 
+# Above this many local rows, scanning the whole Airtable table is cheaper than OR lookups.
+MAX_IDS_PER_LOOKUP = 500
+# Lower bound for the first keyset page of a push.
+_MIN_ROWID = -(2**63)
+_PASSTHROUGH_TYPES = frozenset({int, float, str, bool, type(None)})
+EXPECTED_CACHE_SIZE = 8
 
-class _StoreLike(Protocol):
-    def fetch_all(self, query: str, params: list[object] | None = None): ...
-
-    def get_mirror_state(self, table_name: str, external_id: str): ...
-
-    def upsert_mirror_state(
-        self,
-        table_name: str,
-        external_id: str,
-        record_id: str | None,
-        mirror_version: int,
-        mirror_updated_at: str | None,
-    ) -> None: ...
+# (external_id, existing record_id, mirror_version, airtable_fields)
+_PushItem = tuple[str, str | None, int, dict[str, Any]]
+# (external_id, record_id, mirror_version, mirror_updated_at)
+_PushResult = tuple[str, str, int, str]
+# (local column names, Airtable field names), both in mapping order
+FieldArrays = tuple[tuple[str, ...], tuple[str, ...]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AirtableMapping:
     mirror_fields: dict[str, dict[str, Any]]
     tables: dict[str, dict[str, dict[str, str]]]
+    field_arrays: dict[str, FieldArrays] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        arrays: dict[str, FieldArrays] = {}
+        for table_key, table_def in self.tables.items():
+            fields_map = table_def.get("fields") if isinstance(table_def, dict) else None
+            if isinstance(fields_map, dict):
+                arrays[table_key] = (tuple(fields_map), tuple(fields_map.values()))
+        object.__setattr__(self, "field_arrays", arrays)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FieldExpectation:
     name: str
     field_type: str
@@ -85,7 +101,7 @@ class FieldExpectation:
     domain_field: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableExpectation:
     key: str
     display_name: str
@@ -113,13 +129,28 @@ class SchemaDiff:
             or self.type_mismatches
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        # Shallow: the JSON encoder walks the nested lists, so there is nothing to copy.
+        return dict(self.__dict__)
+
 
 class MirrorError(RuntimeError):
     pass
 
 
+_expected_cache: dict[
+    tuple[int, int, bool], tuple[AirtableMapping, Schema, dict[str, TableExpectation]]
+] = {}
+
+
 def load_mapping(mapping_path: Path) -> AirtableMapping:
-    data = yaml.safe_load(mapping_path.read_text(encoding="utf-8")) or {}
+    stat = mapping_path.stat()
+    return _load_mapping_cached(str(mapping_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_mapping_cached(path: str, mtime_ns: int, size: int) -> AirtableMapping:
+    data = read_yaml(Path(path)) or {}
     mirror_fields = data.get("mirror_fields", {})
     tables = data.get("tables", {})
     if not isinstance(tables, dict):
@@ -134,7 +165,16 @@ def validate_schema(
     table_ids: dict[str, str],
     include_modified_time: bool = True,
 ) -> None:
-    diff = diff_schema(client.list_tables(), mapping, schema, table_ids, include_modified_time)
+    diff = diff_schema(
+        client.list_tables(),
+        mapping,
+        schema,
+        table_ids,
+        include_modified_time,
+        fields_by_table=client.fields_by_table(),
+        tables_index=client.tables_index(),
+        fail_fast=True,
+    )
     if diff.has_errors:
         raise MirrorError(_format_schema_errors(diff))
 
@@ -146,12 +186,47 @@ def push_all(
     table_ids: dict[str, str],
     logger: Any | None = None,
 ) -> None:
-    for table_name, table_def in mapping.tables.items():
+    jobs: list[tuple[str, str, FieldArrays]] = []
+    for table_name in mapping.tables:
         table_id = table_ids.get(table_name)
         if not table_id:
             raise MirrorError(f"Missing table id for {table_name} in workspace config.")
-        with store.session() as session:
-            _push_table(session, client, table_name, table_id, table_def, logger)
+        jobs.append((table_name, table_id, mapping.field_arrays.get(table_name, ((), ()))))
+    if not jobs:
+        return
+
+    now = utc_now_iso()
+    # Workers hand each accepted batch to this thread, which records it right away; a None
+    # marks a finished table. SQLite writes and event logging stay on this thread.
+    pushed: queue.SimpleQueue[tuple[str, tuple[str, ...], list[_PushResult]] | None] = (
+        queue.SimpleQueue()
+    )
+    stop = Event()
+    record_error: Exception | None = None
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(jobs))) as executor:
+        futures = [
+            executor.submit(_push_table, store, client, *job, now, pushed.put, stop) for job in jobs
+        ]
+        for future in futures:
+            future.add_done_callback(lambda _: pushed.put(None))
+        running = len(futures)
+        while running:
+            item = pushed.get()
+            if item is None:
+                running -= 1
+                continue
+            try:
+                with store.session(immediate=True) as session:
+                    _record_push(session, *item, logger)
+            except Exception as exc:
+                # Send no new batches, but keep recording the ones already in flight.
+                stop.set()
+                record_error = record_error or exc
+    # Raise only after every batch Airtable accepted, from any table, has been recorded.
+    if record_error is not None:
+        raise record_error
+    for future in futures:
+        future.result()
 
 
 def diff_schema(
@@ -160,10 +235,12 @@ def diff_schema(
     schema: Schema,
     table_ids: dict[str, str],
     include_modified_time: bool = True,
+    fields_by_table: dict[str, dict[str, Any]] | None = None,
+    tables_index: TablesIndex | None = None,
+    fail_fast: bool = False,
 ) -> SchemaDiff:
     expected = _expected_tables(mapping, schema, include_modified_time)
-    tables_by_id = {table["id"]: table for table in tables_meta}
-    tables_by_name = {table["name"]: table for table in tables_meta}
+    tables_by_id, tables_by_name = tables_index or index_tables(tables_meta)
 
     missing_table_ids: list[str] = []
     missing_tables: list[str] = []
@@ -174,6 +251,9 @@ def diff_schema(
     discovered_table_ids: dict[str, str] = {}
 
     for table_key, expectation in expected.items():
+        # Callers that only need a verdict stop after the first table with errors.
+        if fail_fast and (missing_table_ids or missing_tables or missing_fields or type_mismatches):
+            break
         table_id = (table_ids.get(table_key) or "").strip()
         table_meta = None
         if table_id:
@@ -192,7 +272,7 @@ def diff_schema(
         if table_meta is None:
             continue
 
-        existing_fields = {field["name"]: field for field in table_meta.get("fields", [])}
+        existing_fields = existing_fields_by_name(table_meta, fields_by_table)
         missing = [
             field_name for field_name in expectation.fields if field_name not in existing_fields
         ]
@@ -245,14 +325,15 @@ def bootstrap_schema(
     table_ids: dict[str, str],
     apply: bool = False,
     include_modified_time: bool = True,
-) -> tuple[list[str], dict[str, str]]:
-    tables_meta = client.list_tables()
-    tables_by_id = {table["id"]: table for table in tables_meta}
-    tables_by_name = {table["name"]: table for table in tables_meta}
+) -> tuple[list[str], dict[str, str], list[str]]:
+    # Snapshot both indexes up front; applying changes invalidates the client's cache.
+    tables_by_id, tables_by_name = client.tables_index()
+    fields_by_table = client.fields_by_table()
     expected = _expected_tables(mapping, schema, include_modified_time)
 
     actions: list[str] = []
     discovered_table_ids: dict[str, str] = {}
+    missing_modified_time: list[str] = []
 
     for table_key, expectation in expected.items():
         table_id = (table_ids.get(table_key) or "").strip()
@@ -275,8 +356,9 @@ def bootstrap_schema(
                     )
                     table_meta = created
                     table_id = created["id"]
-                    tables_by_id[table_id] = created
-                    tables_by_name[created["name"]] = created
+                    # The index is shared with the client, so extend copies of it.
+                    tables_by_id = {**tables_by_id, table_id: created}
+                    tables_by_name = {**tables_by_name, created["name"]: created}
             else:
                 table_id = table_meta["id"]
             if table_meta is not None:
@@ -285,7 +367,7 @@ def bootstrap_schema(
         if table_meta is None:
             continue
 
-        existing_fields = {field["name"]: field for field in table_meta.get("fields", [])}
+        existing_fields = existing_fields_by_name(table_meta, fields_by_table)
         for field_name, spec in expectation.fields.items():
             if field_name in existing_fields:
                 continue
@@ -298,74 +380,160 @@ def bootstrap_schema(
                 client.create_field(table_id, field_name, spec.field_type, spec.options)
 
         if include_modified_time and MODIFIED_TIME_FIELD not in existing_fields:
+            missing_modified_time.append(table_key)
             actions.append(
                 f"MANUAL: create {expectation.display_name} -> {MODIFIED_TIME_FIELD} (lastModifiedTime)"
             )
 
-    return actions, discovered_table_ids
+    return actions, discovered_table_ids, missing_modified_time
 
 
 def _push_table(
-    store: _StoreLike,
+    store: SqliteStore,
     client: AirtableClient,
     table_name: str,
     table_id: str,
-    table_def: dict[str, Any],
-    logger: Any | None,
+    field_arrays: FieldArrays,
+    now: str,
+    on_batch: Callable[[tuple[str, tuple[str, ...], list[_PushResult]]], None],
+    stop: Event,
 ) -> None:
-    fields_map = table_def.get("fields", {})
-    external_id_field = _find_external_id_field(fields_map)
-    if not external_id_field:
+    domain_names, airtable_names = field_arrays
+    if "ExternalId" not in airtable_names:
         raise MirrorError(f"Table {table_name} mapping must map a field to ExternalId.")
+    external_id_index = airtable_names.index("ExternalId")
+    external_id_field = domain_names[external_id_index]
+
+    columns = ", ".join(f"t.{quote_identifier(column)}" for column in domain_names)
+    # Keyset pages by rowid, so no read cursor stays open across the Airtable calls.
+    query = (
+        f"SELECT {columns}, m.mirror_version, t.rowid FROM {table_name} AS t "
+        "LEFT JOIN mirror_state AS m "
+        f"ON m.table_name = ? AND m.external_id = t.{quote_identifier(external_id_field)} "
+        "WHERE t.rowid > ? ORDER BY t.rowid LIMIT ?"
+    )
+    # Row columns follow domain_names, so values pair with Airtable names positionally.
+    serialize = _serialize_value
+    updates: list[_PushItem] = []
+    upserts: list[_PushItem] = []
+    # One row past the lookup limit tells us whether to scan the whole table instead.
+    rows = _read_page(store, query, (table_name, _MIN_ROWID, MAX_IDS_PER_LOOKUP + 1))
+    existing = _existing_record_ids(client, table_id, [row[external_id_index] for row in rows])
+    while rows:
+        for row in rows:
+            external_id = row[external_id_index]
+            mirror_version = row[-2]
+            next_version = int(mirror_version) + 1 if mirror_version is not None else 1
+            airtable_fields = {
+                airtable_field: serialize(value)
+                for airtable_field, value in zip(airtable_names, row, strict=False)
+            }
+            airtable_fields["ExternalId"] = external_id
+            airtable_fields["MirrorVersion"] = next_version
+            airtable_fields["MirrorUpdatedAt"] = now
+
+            record_id = existing.get(external_id)
+            batch = updates if record_id else upserts
+            batch.append((external_id, record_id, next_version, airtable_fields))
+            if len(batch) >= MAX_RECORDS_PER_REQUEST:
+                if stop.is_set():
+                    return
+                results = _send_push_batch(client, table_name, table_id, batch)
+                on_batch((table_name, domain_names, results))
+                batch.clear()
+        rows = _read_page(store, query, (table_name, rows[-1][-1], MAX_IDS_PER_LOOKUP))
+    for batch in (updates, upserts):
+        if batch:
+            if stop.is_set():
+                return
+            results = _send_push_batch(client, table_name, table_id, batch)
+            on_batch((table_name, domain_names, results))
+
+
+def _read_page(store: SqliteStore, query: str, params: tuple[Any, ...]) -> list[Any]:
+    # Fully fetched, so the pooled connection releases its WAL snapshot before returning.
+    with store.read() as conn:
+        return conn.execute(query, params).fetchall()
+
+
+def _existing_record_ids(
+    client: AirtableClient, table_id: str, external_ids: list[str]
+) -> dict[str, str]:
+    try:
+        if len(external_ids) <= MAX_IDS_PER_LOOKUP:
+            found = client.find_records_by_external_ids(table_id, external_ids)
+            return {external_id: record.record_id for external_id, record in found.items()}
+        records = client.list_records(table_id, fields=["ExternalId"])
+    except AirtableError as exc:
+        raise MirrorError(str(exc)) from exc
+    existing: dict[str, str] = {}
+    for record in records:
+        external_id = record.fields.get("ExternalId")
+        if not external_id:
+            continue
+        if external_id in existing:
+            raise MirrorError(f"Multiple Airtable records found for ExternalId {external_id}.")
+        existing[external_id] = record.record_id
+    return existing
 
-    rows = store.fetch_all(f"SELECT * FROM {table_name}")
-    for row in rows:
-        external_id = row[external_id_field]
-        mirror_state = store.get_mirror_state(table_name, external_id)
-        next_version = int(mirror_state["mirror_version"]) + 1 if mirror_state else 1
-        now = datetime.now(UTC).replace(microsecond=0).isoformat()
-
-        airtable_fields = {}
-        for field_name, airtable_field in fields_map.items():
-            airtable_fields[airtable_field] = _serialize_value(row[field_name])
-        airtable_fields["ExternalId"] = external_id
-        airtable_fields["MirrorVersion"] = next_version
-        airtable_fields["MirrorUpdatedAt"] = now
-
-        record_id = None
-        try:
-            existing = client.find_record_by_external_id(table_id, external_id)
-            if existing:
-                record = client.update_record(table_id, existing.record_id, airtable_fields)
-                record_id = record.record_id
-            else:
-                record = client.create_record(table_id, airtable_fields)
-                record_id = record.record_id
-        except AirtableError as exc:
-            raise MirrorError(str(exc)) from exc
-
-        store.upsert_mirror_state(table_name, external_id, record_id, next_version, now)
-        if logger is not None:
-            logger.log(
-                event_type="push",
-                entity_type=table_name,
-                external_id=external_id,
-                changed_fields=list(fields_map.keys()),
-                conflict=False,
+
+def _send_push_batch(
+    client: AirtableClient,
+    table_name: str,
+    table_id: str,
+    batch: list[_PushItem],
+) -> list[_PushResult]:
+    try:
+        if batch[0][1]:
+            records = client.update_records(
+                table_id,
+                [
+                    AirtableRecord(record_id=record_id, fields=fields)
+                    for _, record_id, _, fields in batch
+                ],
+            )
+        else:
+            records = client.upsert_records(
+                table_id, [fields for _, _, _, fields in batch], merge_on=["ExternalId"]
             )
+    except AirtableError as exc:
+        raise MirrorError(str(exc)) from exc
+    if len(records) != len(batch):
+        raise MirrorError(
+            f"Airtable push for {table_name} returned {len(records)} records for {len(batch)} rows."
+        )
+    return [
+        (external_id, record.record_id, next_version, fields["MirrorUpdatedAt"])
+        for (external_id, _, next_version, fields), record in zip(batch, records, strict=True)
+    ]
 
 
-def _find_external_id_field(fields_map: dict[str, str]) -> str | None:
-    for field_name, airtable_field in fields_map.items():
-        if airtable_field == "ExternalId":
-            return field_name
-    return None
+def _record_push(
+    session: SqliteSession,
+    table_name: str,
+    changed_fields: tuple[str, ...],
+    results: list[_PushResult],
+    logger: Any | None,
+) -> None:
+    session.upsert_mirror_state_many(
+        (table_name, external_id, record_id, mirror_version, mirror_updated_at)
+        for external_id, record_id, mirror_version, mirror_updated_at in results
+    )
+    if logger is None:
+        return
+    for external_id, _, _, mirror_updated_at in results:
+        logger.log(
+            event_type="push",
+            entity_type=table_name,
+            external_id=external_id,
+            changed_fields=changed_fields,
+            conflict=False,
+            ts=mirror_updated_at,
+        )
 
 
 def _serialize_value(value: Any) -> Any:
-    if value is None:
-        return None
-    if isinstance(value, (int, float, str)):
+    if type(value) in _PASSTHROUGH_TYPES:
         return value
     return str(value)
 
@@ -375,6 +543,45 @@ def _expected_tables(
     schema: Schema,
     include_modified_time: bool,
 ) -> dict[str, TableExpectation]:
+    # load_mapping/load_schema hand back the same objects, so identity is a cheap key;
+    # the entry keeps both alive so their ids cannot be reused while cached.
+    key = (id(mapping), id(schema), include_modified_time)
+    cached = _expected_cache.get(key)
+    if cached is None:
+        if len(_expected_cache) >= EXPECTED_CACHE_SIZE:
+            _expected_cache.pop(next(iter(_expected_cache)))
+        cached = (mapping, schema, _build_expected_tables(mapping, schema, include_modified_time))
+        _expected_cache[key] = cached
+    return cached[2]
+
+
+def _build_expected_tables(
+    mapping: AirtableMapping,
+    schema: Schema,
+    include_modified_time: bool,
+) -> dict[str, TableExpectation]:
+    # Mirror and system fields are the same for every table; resolve them once and share.
+    shared_fields = {
+        mirror_name: FieldExpectation(
+            name=mirror_name,
+            field_type=_airtable_type_for(mirror_name, mirror_spec),
+            options=None,
+            required=True,
+            source="mirror",
+            domain_field=None,
+        )
+        for mirror_name, mirror_spec in mapping.mirror_fields.items()
+    }
+    if include_modified_time:
+        shared_fields[MODIFIED_TIME_FIELD] = FieldExpectation(
+            name=MODIFIED_TIME_FIELD,
+            field_type="lastModifiedTime",
+            options=None,
+            required=False,
+            source="system",
+            domain_field=None,
+        )
+
     expected: dict[str, TableExpectation] = {}
     for table_key, table_def in mapping.tables.items():
         schema_table = schema.tables.get(table_key)
@@ -408,26 +615,7 @@ def _expected_tables(
             if domain_field not in {"created_at", "updated_at"} and airtable_field != "ExternalId":
                 human_fields.append(airtable_field)
 
-        for mirror_name, mirror_spec in mapping.mirror_fields.items():
-            mirror_type = _airtable_type_for(mirror_name, mirror_spec)
-            fields[mirror_name] = FieldExpectation(
-                name=mirror_name,
-                field_type=mirror_type,
-                options=None,
-                required=True,
-                source="mirror",
-                domain_field=None,
-            )
-
-        if include_modified_time:
-            fields[MODIFIED_TIME_FIELD] = FieldExpectation(
-                name=MODIFIED_TIME_FIELD,
-                field_type="lastModifiedTime",
-                options=None,
-                required=False,
-                source="system",
-                domain_field=None,
-            )
+        fields.update(shared_fields)
 
         expected[table_key] = TableExpectation(
             key=table_key,
@@ -490,7 +678,15 @@ def _airtable_type_for(field_name: str, spec: dict[str, Any]) -> str:
 def _is_type_compatible(expected: str, actual: str) -> bool:
     if expected == actual:
         return True
-    return actual in COMPATIBLE_TYPES.get(expected, set())
+    return actual in COMPATIBLE_TYPES.get(expected, _NO_COMPATIBLE_TYPES)
+
+
+def existing_fields_by_name(
+    table_meta: dict[str, Any], fields_by_table: dict[str, dict[str, Any]] | None
+) -> dict[str, Any]:
+    if fields_by_table is not None and table_meta["id"] in fields_by_table:
+        return fields_by_table[table_meta["id"]]
+    return {field["name"]: field for field in table_meta.get("fields", [])}
 
 
 def _discover_table_by_name(
@@ -508,32 +704,32 @@ def _missing_modified_watch_fields(
     record_fields = options.get("recordFields")
     if not isinstance(record_fields, list) or not record_fields:
         return expected_field_names
-    ids_by_name = {
-        field["name"]: field["id"] for field in existing_fields.values() if "id" in field
-    }
+    watched = frozenset(record_fields)
     missing = []
     for field_name in expected_field_names:
-        field_id = ids_by_name.get(field_name)
-        if field_id and field_id not in record_fields:
+        field_id = (existing_fields.get(field_name) or {}).get("id")
+        if field_id and field_id not in watched:
             missing.append(field_name)
     return missing
 
 
-def _format_schema_errors(diff: SchemaDiff) -> str:
-    parts: list[str] = []
+def iter_diff_messages(diff: SchemaDiff) -> Iterator[str]:
     if diff.missing_table_ids:
-        parts.append(f"Missing table IDs: {', '.join(sorted(diff.missing_table_ids))}")
+        yield f"Missing table IDs: {', '.join(diff.missing_table_ids)}"
     if diff.missing_tables:
-        parts.append(f"Unknown Airtable tables: {', '.join(sorted(diff.missing_tables))}")
+        yield f"Missing Airtable tables: {', '.join(diff.missing_tables)}"
     for table_key, fields in diff.missing_fields.items():
-        parts.append(f"{table_key} missing fields: {', '.join(sorted(fields))}")
+        yield f"{table_key} missing fields: {', '.join(fields)}"
     for table_key, mismatches in diff.type_mismatches.items():
         details = ", ".join(
             f"{field} (expected {expected}, got {actual})" for field, expected, actual in mismatches
         )
-        parts.append(f"{table_key} type mismatches: {details}")
+        yield f"{table_key} type mismatches: {details}"
+    if diff.missing_modified_time:
+        yield f"Missing AirtableModifiedAt fields: {', '.join(diff.missing_modified_time)}"
     for table_key, missing in diff.misconfigured_modified_time.items():
-        parts.append(
-            f"{table_key} AirtableModifiedAt missing watched fields: {', '.join(sorted(missing))}"
-        )
-    return "; ".join(parts) if parts else "Airtable schema validation failed."
+        yield f"{table_key} AirtableModifiedAt missing watched fields: {', '.join(missing)}"
+
+
+def _format_schema_errors(diff: SchemaDiff) -> str:
+    return "; ".join(iter_diff_messages(diff)) or "Airtable schema validation failed."
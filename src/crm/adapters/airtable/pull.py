@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
+from itertools import batched
 from typing import Any
 
-from crm.adapters.airtable.client import AirtableClient
+from crm.adapters.airtable.client import (
+    MAX_CONCURRENT_REQUESTS,
+    AirtableClient,
+    AirtableError,
+    AirtableRecord,
+)
 from crm.adapters.airtable.mirror import AirtableMapping
-from crm.services.pull import PullDecision, decide_pull_action, diff_fields
+from crm.services.pull import (
+    PullDecision,
+    build_diff_plan,
+    decide_pull_action,
+    diff_planned_fields,
+)
 from crm.services.utils import utc_now_iso
 from crm.store.migrations import Schema
-from crm.store.sqlite import SqliteSession, SqliteStore
+from crm.store.sqlite import VALUES_BATCH_ROWS, SqliteSession, SqliteStore, quote_identifier
 
 MODIFIED_FIELD = "AirtableModifiedAt"
+# Airtable error types reported when a requested field or formula reference does not exist.
+_UNKNOWN_FIELD_ERRORS = frozenset({"UNKNOWN_FIELD_NAME", "INVALID_FILTER_BY_FORMULA"})
 
+_MIRROR_COLUMNS = ("table_name", "external_id", "record_id", "mirror_version", "mirror_updated_at")
+_MIRROR_STATE_SQL = f"SELECT {', '.join(_MIRROR_COLUMNS)} FROM mirror_state WHERE table_name = ?"
 
-@dataclass
+# (airtable_field, converter to the local column type)
+_Column = tuple[str, Callable[[Any], Any]]
+
+
+@dataclass(slots=True)
 class PullSummary:
     scanned: int
     skipped: int
@@ -24,7 +45,7 @@ class PullSummary:
     ignored: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PullChange:
     table: str
     external_id: str
@@ -37,6 +58,18 @@ class PullError(RuntimeError):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class _TablePull:
+    table_name: str
+    table_id: str
+    fields_map: dict[str, str]
+    external_id_field: str
+    schema_fields: dict[str, Any]
+    query_fields: list[str]
+    filter_formula: str | None
+    unverified_modified_field: bool
+
+
 def pull_records(
     store: SqliteStore,
     client: AirtableClient,
@@ -53,6 +86,7 @@ def pull_records(
     changes: list[PullChange] = []
     accept_remote = accept_remote or set()
 
+    plans: list[_TablePull] = []
     for table_name, table_def in mapping.tables.items():
         table_id = table_ids.get(table_name)
         if not table_id:
@@ -62,9 +96,9 @@ def pull_records(
         if not external_id_field:
             raise PullError(f"Table {table_name} mapping must map a field to ExternalId.")
 
-        schema_fields = (schema.tables.get(table_name) or {}).get("fields", {})
         table_meta = tables_meta.get(table_id) if tables_meta else None
-        has_modified_field = bool(table_meta and _has_modified_field(table_meta))
+        # Without metadata, assume the modified field exists and fall back if Airtable rejects it.
+        has_modified_field = _has_modified_field(table_meta) if table_meta else True
         query_fields = [fields_map[field] for field in fields_map] + [
             "ExternalId",
             "MirrorVersion",
@@ -75,113 +109,302 @@ def pull_records(
         filter_formula = None
         if last_pull_at and last_pull_at.get(table_name) and has_modified_field:
             filter_formula = _modified_since_formula(last_pull_at[table_name])
-        records = client.list_records(table_id, fields=query_fields, filter_formula=filter_formula)
-
-        with store.session() as session:
-            for record in records:
-                summary.scanned += 1
-                external_id = record.fields.get("ExternalId")
-                if not external_id:
-                    summary.ignored += 1
-                    continue
-                remote_fields = record.fields
-                local_row = session.fetch_one(
-                    f"SELECT * FROM {table_name} WHERE {external_id_field} = ?",
-                    (external_id,),
-                )
-                local_dict = dict(local_row) if local_row else None
-                mirror_state = session.get_mirror_state(table_name, external_id)
-                mirror_dict = dict(mirror_state) if mirror_state else None
-                changed_fields = diff_fields(
-                    local_row=local_dict,
-                    remote_fields=remote_fields,
-                    field_map=fields_map,
-                    schema_fields=schema_fields,
-                )
-                decision = decide_pull_action(
-                    local_row=local_dict,
-                    mirror_state=mirror_dict,
-                    changed_fields=changed_fields,
-                    remote_modified_at=remote_fields.get(MODIFIED_FIELD),
+        plans.append(
+            _TablePull(
+                table_name=table_name,
+                table_id=table_id,
+                fields_map=fields_map,
+                external_id_field=external_id_field,
+                schema_fields=(schema.tables.get(table_name) or {}).get("fields", {}),
+                query_fields=query_fields,
+                filter_formula=filter_formula,
+                unverified_modified_field=table_meta is None,
+            )
+        )
+    if not plans:
+        return summary, changes
+
+    now = utc_now_iso()
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(plans))) as executor:
+        streams = [_read_ahead(executor, _table_pages(client, plan)) for plan in plans]
+        for plan, records in zip(plans, streams, strict=True):
+            _pull_table(
+                store,
+                plan,
+                records,
+                summary,
+                changes,
+                apply=apply,
+                accept_remote=accept_remote,
+                logger=logger,
+                now=now,
+            )
+
+    return summary, changes
+
+
+def _table_pages(client: AirtableClient, plan: _TablePull) -> Iterator[list[AirtableRecord]]:
+    pages = client.iter_record_pages(
+        plan.table_id, fields=plan.query_fields, filter_formula=plan.filter_formula
+    )
+    if not plan.unverified_modified_field:
+        yield from pages
+        return
+    try:
+        first = next(pages, None)
+    except AirtableError as exc:
+        if not _is_missing_modified_field(exc):
+            raise
+        fields = [field for field in plan.query_fields if field != MODIFIED_FIELD]
+        yield from client.iter_record_pages(plan.table_id, fields=fields)
+        return
+    if first is not None:
+        yield first
+        yield from pages
+
+
+def _is_missing_modified_field(exc: AirtableError) -> bool:
+    # Only a missing AirtableModifiedAt falls back; other validation errors surface.
+    return (
+        exc.status_code == 422
+        and exc.error_type in _UNKNOWN_FIELD_ERRORS
+        and MODIFIED_FIELD.lower() in str(exc).lower()
+    )
+
+
+def _read_ahead(
+    executor: ThreadPoolExecutor, pages: Iterator[list[AirtableRecord]]
+) -> Iterator[AirtableRecord]:
+    # Request the first page now so every table starts fetching before any is processed.
+    future = executor.submit(next, pages, None)
+    return _drain_pages(executor, pages, future)
+
+
+def _drain_pages(
+    executor: ThreadPoolExecutor,
+    pages: Iterator[list[AirtableRecord]],
+    future: Future[list[AirtableRecord] | None],
+) -> Iterator[AirtableRecord]:
+    while (page := future.result()) is not None:
+        future = executor.submit(next, pages, None)
+        yield from page
+
+
+def _pull_table(
+    store: SqliteStore,
+    plan: _TablePull,
+    records: Iterable[AirtableRecord],
+    summary: PullSummary,
+    changes: list[PullChange],
+    apply: bool,
+    accept_remote: set[str],
+    logger: Any | None,
+    now: str,
+) -> None:
+    table_name = plan.table_name
+    fields_map = plan.fields_map
+    external_id_field = plan.external_id_field
+    schema_fields = plan.schema_fields
+    # The diff reads the mapped columns; has_local_changes also needs updated_at.
+    local_columns = list(fields_map)
+    if "updated_at" in schema_fields and "updated_at" not in fields_map:
+        local_columns.append("updated_at")
+    with store.session() as session:
+        local_by_ext, mirror_by_ext = _read_rows(
+            session, table_name, local_columns, external_id_field
+        )
+    diff_plan = build_diff_plan(fields_map, schema_fields)
+    insert_columns = [
+        (airtable_field, _converter(schema_fields.get(local_field)))
+        for local_field, airtable_field in fields_map.items()
+    ]
+    update_fields = [field for field in fields_map if field not in {"created_at", "updated_at"}]
+    update_columns = [
+        column
+        for local_field, column in zip(fields_map, insert_columns, strict=True)
+        if local_field not in {"created_at", "updated_at"}
+    ]
+    stamps = sum(1 for field in ("created_at", "updated_at") if field in schema_fields)
+    # (external_id, params)
+    insert_rows: list[tuple[str, list[Any]]] = []
+    update_rows: list[tuple[str, list[Any]]] = []
+    # Keyed by ExternalId so a repeated record upserts its mirror state once.
+    mirror_rows: dict[str, tuple[str, str, str, int, str]] = {}
+    applied: list[tuple[str, list[str]]] = []
+    # The rows each staged ExternalId was decided against, and the changes staged for it.
+    baseline: dict[str, tuple[dict[str, Any] | None, dict[str, Any] | None]] = {}
+    staged_changes: dict[str, list[PullChange]] = {}
+    for record in records:
+        summary.scanned += 1
+        external_id = record.fields.get("ExternalId")
+        if not external_id:
+            summary.ignored += 1
+            continue
+        remote_fields = record.fields
+        local_dict = local_by_ext.get(external_id)
+        mirror_dict = mirror_by_ext.get(external_id)
+        changed_fields = diff_planned_fields(
+            local_row=local_dict, remote_fields=remote_fields, plan=diff_plan
+        )
+        decision = decide_pull_action(
+            local_row=local_dict,
+            mirror_state=mirror_dict,
+            changed_fields=changed_fields,
+            remote_modified_at=remote_fields.get(MODIFIED_FIELD),
+        )
+        if decision.action == "skip":
+            summary.skipped += 1
+            continue
+        if decision.action == "conflict" and external_id in accept_remote:
+            decision = PullDecision(action="apply", changed_fields=changed_fields)
+
+        change = PullChange(
+            table=table_name,
+            external_id=external_id,
+            action=decision.action,
+            changed_fields=changed_fields,
+            reason=decision.reason,
+        )
+        changes.append(change)
+        if decision.action == "conflict":
+            summary.conflicts += 1
+            _log_pull_event(logger, "pull_conflict", table_name, external_id, changed_fields, now)
+            continue
+
+        if apply:
+            baseline.setdefault(external_id, (local_dict, mirror_dict))
+            staged_changes.setdefault(external_id, []).append(change)
+            if decision.action == "create":
+                params = _insert_params(insert_columns, remote_fields, stamps, now)
+                insert_rows.append((external_id, params))
+                staged = dict(zip(fields_map, params, strict=False))
+                summary.created += 1
+            else:
+                params = _update_params(update_columns, remote_fields, now)
+                update_rows.append((external_id, params))
+                staged = {**local_dict, **dict(zip(update_fields, params, strict=False))}
+                summary.applied += 1
+            # A later record with the same ExternalId sees this one, as after a per-row write.
+            staged["updated_at"] = now
+            local_by_ext[external_id] = staged
+            remote_version = remote_fields.get("MirrorVersion")
+            if remote_version is not None:
+                try:
+                    mirror_version = int(remote_version)
+                except (TypeError, ValueError):
+                    mirror_version = mirror_dict["mirror_version"] if mirror_dict else 0
+            else:
+                mirror_version = mirror_dict["mirror_version"] if mirror_dict else 0
+            mirror_rows[external_id] = (
+                table_name,
+                external_id,
+                record.record_id,
+                mirror_version,
+                now,
+            )
+            mirror_by_ext[external_id] = dict(
+                zip(_MIRROR_COLUMNS, mirror_rows[external_id], strict=True)
+            )
+            applied.append((external_id, changed_fields))
+        else:
+            if decision.action == "create":
+                summary.created += 1
+            elif decision.action == "apply":
+                summary.applied += 1
+
+    stale: set[str] = set()
+    if mirror_rows:
+        # Pages are fully read by now, so the write lock is never held across network calls.
+        with store.session(immediate=True) as session:
+            # Rows written locally since the snapshot keep their values and become conflicts.
+            current_local, current_mirror = _read_rows(
+                session, table_name, local_columns, external_id_field, list(baseline)
+            )
+            stale = {
+                external_id
+                for external_id, (local_dict, mirror_dict) in baseline.items()
+                if current_local.get(external_id) != local_dict
+                or current_mirror.get(external_id) != mirror_dict
+            }
+            for external_id in stale:
+                del mirror_rows[external_id]
+            inserts = [params for external_id, params in insert_rows if external_id not in stale]
+            updates = [params for external_id, params in update_rows if external_id not in stale]
+            if inserts:
+                session.executemany(
+                    _insert_statement(table_name, fields_map, schema_fields), inserts
                 )
-                if decision.action == "skip":
-                    summary.skipped += 1
-                    continue
-                if decision.action == "conflict" and external_id in accept_remote:
-                    decision = PullDecision(action="apply", changed_fields=changed_fields)
-
-                changes.append(
-                    PullChange(
-                        table=table_name,
-                        external_id=external_id,
-                        action=decision.action,
-                        changed_fields=changed_fields,
-                        reason=decision.reason,
-                    )
+            if updates:
+                session.executemany(
+                    _update_statement(table_name, external_id_field, fields_map), updates
                 )
-                if decision.action == "conflict":
-                    summary.conflicts += 1
-                    if logger is not None:
-                        logger.log(
-                            event_type="pull_conflict",
-                            entity_type=table_name,
-                            external_id=external_id,
-                            changed_fields=changed_fields,
-                            conflict=True,
-                        )
-                    continue
-
-                if apply:
-                    if decision.action == "create":
-                        _insert_local(
-                            session,
-                            table_name,
-                            external_id_field,
-                            fields_map,
-                            remote_fields,
-                            schema_fields,
-                        )
-                        summary.created += 1
-                    elif decision.action == "apply":
-                        _update_local(
-                            session,
-                            table_name,
-                            external_id_field,
-                            fields_map,
-                            remote_fields,
-                            schema_fields,
-                        )
-                        summary.applied += 1
-                    remote_version = remote_fields.get("MirrorVersion")
-                    if remote_version is not None:
-                        try:
-                            mirror_version = int(remote_version)
-                        except (TypeError, ValueError):
-                            mirror_version = mirror_dict["mirror_version"] if mirror_dict else 0
-                    else:
-                        mirror_version = mirror_dict["mirror_version"] if mirror_dict else 0
-                    session.upsert_mirror_state(
-                        table_name,
-                        external_id,
-                        record.record_id,
-                        mirror_version,
-                        utc_now_iso(),
-                    )
-                    if logger is not None:
-                        logger.log(
-                            event_type="pull_apply",
-                            entity_type=table_name,
-                            external_id=external_id,
-                            changed_fields=changed_fields,
-                            conflict=False,
-                        )
-                else:
-                    if decision.action == "create":
-                        summary.created += 1
-                    elif decision.action == "apply":
-                        summary.applied += 1
+            if mirror_rows:
+                session.upsert_mirror_state_many(mirror_rows.values())
+    for external_id in stale:
+        for change in staged_changes[external_id]:
+            if change.action == "create":
+                summary.created -= 1
+            else:
+                summary.applied -= 1
+            summary.conflicts += 1
+            change.action = "conflict"
+            change.reason = "local_changes"
+            _log_pull_event(
+                logger, "pull_conflict", table_name, external_id, change.changed_fields, now
+            )
+    for external_id, changed_fields in applied:
+        if external_id not in stale:
+            _log_pull_event(logger, "pull_apply", table_name, external_id, changed_fields, now)
 
-    return summary, changes
+
+def _read_rows(
+    session: SqliteSession,
+    table_name: str,
+    local_columns: list[str],
+    external_id_field: str,
+    external_ids: list[str] | None = None,
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    # Local rows and mirror state keyed by ExternalId; the whole table unless ids are given.
+    projection = ", ".join(quote_identifier(column) for column in local_columns)
+    key_index = local_columns.index(external_id_field)
+    local_sql = f"SELECT {projection} FROM {table_name}"
+    mirror_sql = _MIRROR_STATE_SQL
+    batches: Iterable[tuple[str, ...]] = [()]
+    if external_ids is not None:
+        batches = batched(external_ids, VALUES_BATCH_ROWS)
+    local_by_ext: dict[str, dict[str, Any]] = {}
+    mirror_by_ext: dict[str, dict[str, Any]] = {}
+    for batch in batches:
+        local_where = mirror_where = ""
+        if external_ids is not None:
+            marks = ", ".join("?" * len(batch))
+            local_where = f" WHERE {quote_identifier(external_id_field)} IN ({marks})"
+            mirror_where = f" AND external_id IN ({marks})"
+        for row in session.fetch_all_tuples(local_sql + local_where, batch):
+            local_by_ext[row[key_index]] = dict(zip(local_columns, row, strict=True))
+        for row in session.fetch_all_tuples(mirror_sql + mirror_where, (table_name, *batch)):
+            mirror_by_ext[row[1]] = dict(zip(_MIRROR_COLUMNS, row, strict=True))
+    return local_by_ext, mirror_by_ext
+
+
+def _log_pull_event(
+    logger: Any | None,
+    event_type: str,
+    table_name: str,
+    external_id: str,
+    changed_fields: list[str],
+    ts: str,
+) -> None:
+    if logger is None:
+        return
+    logger.log(
+        event_type=event_type,
+        entity_type=table_name,
+        external_id=external_id,
+        changed_fields=changed_fields,
+        conflict=event_type == "pull_conflict",
+        ts=ts,
+    )
 
 
 def _find_external_id_field(fields_map: dict[str, str]) -> str | None:
@@ -191,78 +414,84 @@ def _find_external_id_field(fields_map: dict[str, str]) -> str | None:
     return None
 
 
-def _update_local(
-    session: SqliteSession,
-    table_name: str,
-    external_id_field: str,
-    fields_map: dict[str, str],
-    remote_fields: dict[str, Any],
-    schema_fields: dict[str, Any],
-) -> None:
-    assignments = []
-    params: list[Any] = []
-    for local_field, airtable_field in fields_map.items():
-        if local_field in {"created_at", "updated_at"}:
-            continue
-        value = remote_fields.get(airtable_field)
-        params.append(_convert_value(value, schema_fields.get(local_field)))
-        assignments.append(f"{local_field} = ?")
-    params.append(utc_now_iso())
-    params.append(remote_fields.get("ExternalId"))
+def _update_statement(table_name: str, external_id_field: str, fields_map: dict[str, str]) -> str:
+    assignments = [
+        f"{local_field} = ?"
+        for local_field in fields_map
+        if local_field not in {"created_at", "updated_at"}
+    ]
     assignments.append("updated_at = ?")
-    query = f"UPDATE {table_name} SET {', '.join(assignments)} WHERE {external_id_field} = ?"
-    session.execute(query, params)
+    return f"UPDATE {table_name} SET {', '.join(assignments)} WHERE {external_id_field} = ?"
 
 
-def _insert_local(
-    session: SqliteSession,
-    table_name: str,
-    external_id_field: str,
-    fields_map: dict[str, str],
-    remote_fields: dict[str, Any],
-    schema_fields: dict[str, Any],
-) -> None:
-    columns = []
-    placeholders = []
-    params: list[Any] = []
-    now = utc_now_iso()
-    for local_field, airtable_field in fields_map.items():
-        value = remote_fields.get(airtable_field)
-        columns.append(local_field)
-        params.append(_convert_value(value, schema_fields.get(local_field)))
-        placeholders.append("?")
+def _update_params(columns: list[_Column], remote_fields: dict[str, Any], now: str) -> list[Any]:
+    params = [convert(remote_fields.get(airtable_field)) for airtable_field, convert in columns]
+    params.append(now)
+    params.append(remote_fields.get("ExternalId"))
+    return params
+
+
+def _insert_statement(
+    table_name: str, fields_map: dict[str, str], schema_fields: dict[str, Any]
+) -> str:
+    columns = list(fields_map)
     if "created_at" in schema_fields:
         columns.append("created_at")
-        params.append(now)
-        placeholders.append("?")
     if "updated_at" in schema_fields:
         columns.append("updated_at")
-        params.append(now)
-        placeholders.append("?")
-    query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
-    session.execute(query, params)
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
 
 
-def _convert_value(value: Any, spec: dict[str, Any] | None) -> Any:
-    if value is None:
-        return None
+def _insert_params(
+    columns: list[_Column], remote_fields: dict[str, Any], stamps: int, now: str
+) -> list[Any]:
+    params = [convert(remote_fields.get(airtable_field)) for airtable_field, convert in columns]
+    params.extend([now] * stamps)
+    return params
+
+
+def _converter(spec: dict[str, Any] | None) -> Callable[[Any], Any]:
     field_type = spec.get("type") if isinstance(spec, dict) else None
     if field_type in {"uuid", "text", "enum"}:
-        return str(value)
+        return _to_text
     if field_type == "number":
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+        return _to_number
     if field_type == "bool":
-        if isinstance(value, str):
-            return value.lower() in {"true", "1", "yes"}
-        return bool(value)
+        return _to_bool
     if field_type in {"date", "datetime"}:
-        if isinstance(value, str):
-            return value
-        if isinstance(value, (datetime, date)):
-            return value.isoformat()
+        return _to_iso
+    return _identity
+
+
+def _to_text(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _to_number(value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_bool(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.lower() in {"true", "1", "yes"}
+    return bool(value)
+
+
+def _to_iso(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _identity(value: Any) -> Any:
     return value
 
 
@@ -10,7 +10,9 @@ from crm.adapters.airtable.mirror import (
     SchemaDiff,
     bootstrap_schema,
     diff_schema,
+    existing_fields_by_name,
     expected_tables,
+    iter_diff_messages,
 )
 from crm.store.migrations import Schema
 
@@ -41,38 +43,17 @@ def doctor(
     table_ids: dict[str, str],
     include_modified_time: bool = True,
 ) -> DoctorResult:
-    diff = diff_schema(client.list_tables(), mapping, schema, table_ids, include_modified_time)
-    messages: list[str] = []
-    exit_code = 0
-
-    if diff.missing_table_ids:
-        messages.append(f"Missing table IDs: {', '.join(sorted(diff.missing_table_ids))}")
-        exit_code = 1
-    if diff.missing_tables:
-        messages.append(f"Missing Airtable tables: {', '.join(sorted(diff.missing_tables))}")
-        exit_code = 1
-    for table_key, fields in diff.missing_fields.items():
-        messages.append(f"{table_key} missing fields: {', '.join(sorted(fields))}")
-        exit_code = 1
-    for table_key, mismatches in diff.type_mismatches.items():
-        details = ", ".join(
-            f"{field} (expected {expected}, got {actual})" for field, expected, actual in mismatches
-        )
-        messages.append(f"{table_key} type mismatches: {details}")
-        exit_code = 1
-
-    if diff.missing_modified_time:
-        messages.append(
-            "Missing AirtableModifiedAt fields: " + ", ".join(sorted(diff.missing_modified_time))
-        )
-        if exit_code == 0:
-            exit_code = 1
-    for table_key, missing_fields in diff.misconfigured_modified_time.items():
-        messages.append(
-            f"{table_key} AirtableModifiedAt missing watched fields: {', '.join(sorted(missing_fields))}"
-        )
-        if exit_code == 0:
-            exit_code = 1
+    diff = diff_schema(
+        client.list_tables(),
+        mapping,
+        schema,
+        table_ids,
+        include_modified_time,
+        fields_by_table=client.fields_by_table(),
+        tables_index=client.tables_index(),
+    )
+    messages = list(iter_diff_messages(diff))
+    exit_code = 1 if messages else 0
 
     if exit_code == 0:
         messages.append("Airtable mirror schema looks OK.")
@@ -87,7 +68,7 @@ def bootstrap(
     apply: bool = False,
     include_modified_time: bool = True,
 ) -> BootstrapResult:
-    actions, discovered = bootstrap_schema(
+    actions, discovered, missing_modified_time = bootstrap_schema(
         client,
         mapping,
         schema,
@@ -95,11 +76,21 @@ def bootstrap(
         apply=apply,
         include_modified_time=include_modified_time,
     )
-    diff = diff_schema(client.list_tables(), mapping, schema, table_ids, include_modified_time)
+    if apply:
+        # Tables and fields may have changed; re-read them for the final report.
+        missing_modified_time = diff_schema(
+            client.list_tables(),
+            mapping,
+            schema,
+            table_ids,
+            include_modified_time,
+            fields_by_table=client.fields_by_table(),
+            tables_index=client.tables_index(),
+        ).missing_modified_time
     return BootstrapResult(
         actions=actions,
         discovered_table_ids=discovered,
-        missing_modified_time=diff.missing_modified_time,
+        missing_modified_time=missing_modified_time,
     )
 
 
@@ -111,8 +102,8 @@ def configure_modified_time_fields(
     apply: bool,
 ) -> list[str]:
     actions: list[str] = []
-    tables = client.list_tables()
-    tables_by_id = {table["id"]: table for table in tables}
+    tables_by_id, _ = client.tables_index()
+    fields_by_table = client.fields_by_table()
     expected = expected_tables(mapping, schema, include_modified_time=True)
 
     for table_key, expectation in expected.items():
@@ -122,8 +113,7 @@ def configure_modified_time_fields(
         table_meta = tables_by_id.get(table_id)
         if not table_meta:
             continue
-        fields = table_meta.get("fields", [])
-        fields_by_name = {field["name"]: field for field in fields}
+        fields_by_name = existing_fields_by_name(table_meta, fields_by_table)
         modified_field = fields_by_name.get(MODIFIED_TIME_FIELD)
         if not modified_field:
             continue
@@ -184,12 +174,13 @@ def _missing_watch_fields(
     record_fields = options.get("recordFields")
     if not isinstance(record_fields, list) or not record_fields:
         return expected_names
+    watched = frozenset(record_fields)
     missing = []
     for name in expected_names:
         field = fields_by_name.get(name)
         if not field:
             continue
         field_id = field.get("id")
-        if field_id and field_id not in record_fields:
+        if field_id and field_id not in watched:
             missing.append(name)
     return missing
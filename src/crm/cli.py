@@ -2,17 +2,18 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
+from collections.abc import Iterable
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from crm import __version__
-from crm.adapters.airtable.client import AirtableClient
-from crm.adapters.airtable.mirror import MirrorError
 from crm.config import (
+    MAPPING_PATH,
+    SCHEMA_PATH,
     WorkspaceError,
     ensure_workspaces_dir,
     load_workspace,
@@ -23,7 +24,7 @@ from crm.config import (
 )
 from crm.domain import rules
 from crm.domain.rules import ValidationError
-from crm.domain.stages import CampaignMemberStatus, SponsorStage
+from crm.domain.stages import CAMPAIGN_MEMBER_STATUS_VALUES, SPONSOR_STAGE_VALUES
 from crm.services import exports, leads, mirror, pull_service, sync, touch
 from crm.services.events import EventLogger
 from crm.services.mirror import MirrorAuthError, MirrorServiceError
@@ -31,7 +32,10 @@ from crm.services.pull_service import PullServiceError
 from crm.services.sync import SyncError
 from crm.services.touch import TouchError
 from crm.services.utils import today_iso
-from crm.store.sqlite import SqliteStore
+from crm.store.sqlite import SqliteStore, get_store
+
+if TYPE_CHECKING:
+    from crm.adapters.airtable.client import AirtableClient
 
 app = typer.Typer(help="Leadops CLI")
 workspace_app = typer.Typer(help="Workspace management")
@@ -50,9 +54,6 @@ app.add_typer(export_app, name="export")
 app.add_typer(mirror_app, name="mirror")
 app.add_typer(open_app, name="open")
 
-SCHEMA_PATH = Path("resources/schema/canonical.yaml")
-MAPPING_PATH = Path("resources/schema/airtable.mapping.yaml")
-
 
 @app.callback()
 def version_callback(
@@ -103,7 +104,7 @@ def workspace_use(name: str = typer.Argument(...)) -> None:
 @schema_app.command("apply")
 def schema_apply(mirror: str | None = typer.Option(None, "--mirror")) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     store.apply_schema(SCHEMA_PATH)
     typer.echo("Applied schema to local SQLite.")
 
@@ -112,6 +113,8 @@ def schema_apply(mirror: str | None = typer.Option(None, "--mirror")) -> None:
             raise typer.BadParameter("Only --mirror airtable is supported.")
         if ws.mirror is None:
             raise typer.BadParameter("Workspace mirror config is missing.")
+        from crm.adapters.airtable.mirror import MirrorError
+
         try:
             sync.validate_mirror(store, ws.mirror, MAPPING_PATH)
             typer.echo("Validated Airtable schema.")
@@ -138,12 +141,12 @@ def mirror_doctor(
         raise typer.Exit(code=2) from exc
     except MirrorServiceError as exc:
         _exit_with_error(str(exc))
-    payload = {
-        "exit_code": result.exit_code,
-        "messages": result.messages,
-        "diff": asdict(result.diff),
-    }
     if json_output:
+        payload = {
+            "exit_code": result.exit_code,
+            "messages": result.messages,
+            "diff": result.diff.to_dict(),
+        }
         typer.echo(json.dumps(payload, indent=2))
     else:
         for message in result.messages:
@@ -189,7 +192,10 @@ def mirror_bootstrap(
             backup_path = update_workspace_table_ids(
                 ws.path / "workspace.yaml", result.discovered_table_ids
             )
-            actions.append(f"UPDATED workspace.yaml (backup: {backup_path.name})")
+            if backup_path is None:
+                actions.append("SKIP: workspace.yaml already has the discovered table ids.")
+            else:
+                actions.append(f"UPDATED workspace.yaml (backup: {backup_path.name})")
 
     payload = {
         "actions": actions,
@@ -231,7 +237,7 @@ def lead_add(
     notes: str | None = typer.Option(None, "--notes"),
 ) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     try:
         due_date = rules.parse_date(due, "due")
     except ValidationError as exc:
@@ -293,32 +299,32 @@ def lead_list(
     status: str | None = typer.Option(None, "--status"),
 ) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
 
     if pipeline == "sponsor":
         if stage:
             try:
-                rules.validate_enum(stage, [s.value for s in SponsorStage], "stage")
+                rules.validate_enum(stage, SPONSOR_STAGE_VALUES, "stage")
             except ValidationError as exc:
                 _exit_with_error(str(exc))
         rows = leads.list_sponsor_leads(store, stage)
-        for row in rows:
-            typer.echo(
-                f"{row['opp_id']} | {row['org_name']} | {row['stage']} | {row['next_action']} | {row['next_action_due']}"
-            )
+        _echo_lines(
+            f"{row.opp_id} | {row.org_name} | {row.stage} | {row.next_action} | {row.next_action_due}"
+            for row in rows
+        )
         return
 
     if pipeline == "attendee":
         if status:
             try:
-                rules.validate_enum(status, [s.value for s in CampaignMemberStatus], "status")
+                rules.validate_enum(status, CAMPAIGN_MEMBER_STATUS_VALUES, "status")
             except ValidationError as exc:
                 _exit_with_error(str(exc))
         rows = leads.list_attendee_leads(store, status)
-        for row in rows:
-            typer.echo(
-                f"{row['member_id']} | {row['campaign_name']} | {row['full_name']} | {row['status']} | {row['next_action']} | {row['next_action_due']}"
-            )
+        _echo_lines(
+            f"{row.member_id} | {row.campaign_name} | {row.full_name} | {row.status} | {row.next_action} | {row.next_action_due}"
+            for row in rows
+        )
         return
 
     raise typer.BadParameter("--pipeline must be 'sponsor' or 'attendee'")
@@ -327,15 +333,15 @@ def lead_list(
 @lead_app.command("next")
 def lead_next(limit: int = typer.Option(10, "--limit")) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     items = leads.next_actions(store, limit=limit)
     if not items:
         typer.echo("No upcoming actions.")
         return
-    for item in items:
-        typer.echo(
-            f"{item.pipeline} | {item.record_id} | {item.org_or_person} | {item.next_action} | {item.next_action_due}"
-        )
+    _echo_lines(
+        f"{item.pipeline} | {item.record_id} | {item.org_or_person} | {item.next_action} | {item.next_action_due}"
+        for item in items
+    )
 
 
 @lead_app.command("touch")
@@ -349,7 +355,7 @@ def lead_touch(
     due: str | None = typer.Option(None, "--due"),
 ) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     try:
         due_date = rules.parse_date(due, "due")
         touch_id = touch.log_touch(
@@ -377,13 +383,15 @@ def sync_push(
     ),
 ) -> None:
     """Mirror local records to Airtable (no manual Airtable data entry required)."""
+    from crm.adapters.airtable.mirror import MirrorError
+
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     if ws.mirror is None:
         raise typer.BadParameter("Workspace mirror config is missing.")
     try:
-        logger = _event_logger(ws, enabled=events)
-        sync.push(store, ws.mirror, MAPPING_PATH, validate=validate, logger=logger)
+        with _event_logger(ws, enabled=events) as logger:
+            sync.push(store, ws.mirror, MAPPING_PATH, validate=validate, logger=logger)
         pull_service.record_push(ws.path)
         typer.echo("Sync push complete.")
     except (MirrorError, SyncError) as exc:
@@ -406,27 +414,27 @@ def sync_pull(
 ) -> None:
     """Pull Airtable edits back into SQLite with conflict detection."""
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     if ws.mirror is None:
         raise typer.BadParameter("Workspace mirror config is missing.")
     try:
-        logger = _event_logger(ws, enabled=events)
-        summary, changes = pull_service.pull(
-            store,
-            ws.mirror,
-            MAPPING_PATH,
-            SCHEMA_PATH,
-            ws.path,
-            apply=apply,
-            accept_remote=set(accept_remote or []),
-            logger=logger,
-        )
+        with _event_logger(ws, enabled=events) as logger:
+            summary, changes = pull_service.pull(
+                store,
+                ws.mirror,
+                MAPPING_PATH,
+                SCHEMA_PATH,
+                ws.path,
+                apply=apply,
+                accept_remote=set(accept_remote or []),
+                logger=logger,
+            )
     except PullServiceError as exc:
         _exit_with_error(str(exc))
     if json_output:
         payload = {
-            "summary": summary.__dict__,
-            "changes": [change.__dict__ for change in changes],
+            "summary": asdict(summary),
+            "changes": [asdict(change) for change in changes],
             "applied": apply,
         }
         typer.echo(json.dumps(payload, indent=2))
@@ -440,7 +448,7 @@ def sync_pull(
 @export_app.command("excel")
 def export_excel(out: str = typer.Option(..., "--out")) -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     exports.export_excel(store, Path(out))
     typer.echo(f"Exported Excel to {out}")
 
@@ -455,10 +463,11 @@ def open_airtable(
         raise typer.BadParameter("Workspace mirror config is missing.")
     if ws.mirror.provider != "airtable":
         raise typer.BadParameter("Only the airtable provider is supported.")
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
 
     records = store.fetch_all(
-        "SELECT table_name, record_id FROM mirror_state WHERE external_id = ?",
+        # Two rows are enough to detect a duplicate ExternalId.
+        "SELECT table_name, record_id FROM mirror_state WHERE external_id = ? LIMIT 2",
         (external_id,),
     )
     record_id = None
@@ -476,7 +485,7 @@ def open_airtable(
                 "AIRTABLE_API_KEY (Airtable PAT) is not set. "
                 "Run scripts/setup-airtable-pat.sh or export it in your shell."
             )
-        client = AirtableClient(api_key=api_key, base_id=ws.mirror.base_id or "")
+        client = _lookup_client(api_key, ws.mirror.base_id or "")
         for candidate_table, table_id in ws.mirror.tables.items():
             if not table_id:
                 continue
@@ -504,15 +513,33 @@ def open_airtable(
 @app.command("snapshot")
 def snapshot() -> None:
     ws = _load_workspace()
-    store = SqliteStore(ws.store.sqlite_path)
+    store = get_store(ws.store.sqlite_path)
     snapshot_dir = Path("data") / "snapshots" / today_iso()
     snapshot_dir.mkdir(parents=True, exist_ok=True)
     if ws.store.sqlite_path.exists():
-        shutil.copy2(ws.store.sqlite_path, snapshot_dir / "local.sqlite")
-    exports.export_csv_tables(store, snapshot_dir)
+        snapshot_path = snapshot_dir / "local.sqlite"
+        store.backup_to(snapshot_path)
+        # Export from the frozen copy so the CSVs match it and the live database stays free.
+        snapshot_store = SqliteStore(snapshot_path)
+        try:
+            exports.export_csv_tables(snapshot_store, snapshot_dir)
+        finally:
+            snapshot_store.close()
+    else:
+        exports.export_csv_tables(store, snapshot_dir)
     typer.echo(f"Snapshot created at {snapshot_dir}")
 
 
+# Kept per process so repeated lookups of an unmirrored ExternalId hit the response cache.
+@lru_cache(maxsize=4)
+def _lookup_client(api_key: str, base_id: str) -> AirtableClient:
+    from crm.adapters.airtable.client import RESPONSE_CACHE_TTL_SECONDS, AirtableClient
+
+    return AirtableClient(
+        api_key=api_key, base_id=base_id, response_cache_ttl=RESPONSE_CACHE_TTL_SECONDS
+    )
+
+
 def _load_workspace():
     try:
         return load_workspace()
@@ -521,6 +548,13 @@ def _load_workspace():
         raise typer.Exit(code=1) from exc
 
 
+def _echo_lines(lines: Iterable[str]) -> None:
+    # One write for the whole listing instead of one echo per row.
+    output = "\n".join(lines)
+    if output:
+        typer.echo(output)
+
+
 def _exit_with_error(message: str) -> None:
     typer.echo(f"Error: {message}", err=True)
     raise typer.Exit(code=1)
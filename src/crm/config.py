@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -7,10 +8,25 @@ from typing import Any
 
 import yaml
 
+from crm.store.migrations import YamlLoader
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as YamlDumper
+
 WORKSPACES_DIR = Path("workspaces")
 CURRENT_WORKSPACE_FILE = WORKSPACES_DIR / ".current"
 WORKSPACE_FILENAME = "workspace.yaml"
 
+# Source checkouts keep resources/ beside src/; otherwise fall back to the working directory.
+_SOURCE_RESOURCES_DIR = Path(__file__).resolve().parents[2] / "resources"
+RESOURCES_DIR = (
+    _SOURCE_RESOURCES_DIR if _SOURCE_RESOURCES_DIR.is_dir() else Path("resources").absolute()
+)
+SCHEMA_PATH = RESOURCES_DIR / "schema" / "canonical.yaml"
+MAPPING_PATH = RESOURCES_DIR / "schema" / "airtable.mapping.yaml"
+
 
 @dataclass(frozen=True)
 class StoreConfig:
@@ -36,6 +52,10 @@ class WorkspaceError(RuntimeError):
     pass
 
 
+# Parsed configs keyed by absolute path; reused while the file's mtime and size are unchanged.
+_workspace_cache: dict[Path, tuple[tuple[int, int], WorkspaceConfig]] = {}
+
+
 def ensure_workspaces_dir() -> None:
     WORKSPACES_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -63,12 +83,21 @@ def load_workspace(name: str | None = None) -> WorkspaceConfig:
     if name is None:
         name = get_current_workspace_name()
     config_path = workspace_config_path(name)
-    if not config_path.exists():
-        raise WorkspaceError(f"Workspace config not found: {config_path}")
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise WorkspaceError(f"Workspace config not found: {config_path}") from None
+    version = (stat.st_mtime_ns, stat.st_size)
+    cache_key = config_path.absolute()
+    cached = _workspace_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    data = yaml.load(config_path.read_text(encoding="utf-8"), Loader=YamlLoader) or {}
     store = _parse_store(data.get("store"), config_path)
     mirror = _parse_mirror(data.get("mirror"))
-    return WorkspaceConfig(name=name, store=store, mirror=mirror, path=config_path.parent)
+    config = WorkspaceConfig(name=name, store=store, mirror=mirror, path=config_path.parent)
+    _workspace_cache[cache_key] = (version, config)
+    return config
 
 
 def write_workspace_config(name: str, base_id: str | None) -> Path:
@@ -94,29 +123,37 @@ def write_workspace_config(name: str, base_id: str | None) -> Path:
         },
     }
     config_path = workspace_config_path(name)
-    config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    config_path.write_text(yaml.dump(config, Dumper=YamlDumper, sort_keys=False), encoding="utf-8")
     return config_path
 
 
-def update_workspace_table_ids(config_path: Path, table_ids: dict[str, str]) -> Path:
+def update_workspace_table_ids(config_path: Path, table_ids: dict[str, str]) -> Path | None:
     if not config_path.exists():
         raise WorkspaceError(f"Workspace config not found: {config_path}")
-    payload = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    text = config_path.read_text(encoding="utf-8")
+    payload = yaml.load(text, Loader=YamlLoader) or {}
     mirror = payload.get("mirror") or {}
     tables = mirror.get("tables") or {}
     if not isinstance(tables, dict):
         raise WorkspaceError("Workspace mirror.tables must be a mapping.")
 
-    for key, value in table_ids.items():
-        if value:
-            tables[key] = value
+    changes = {key: value for key, value in table_ids.items() if value and tables.get(key) != value}
+    if not changes:
+        return None
+    tables.update(changes)
     mirror["tables"] = tables
     payload["mirror"] = mirror
 
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     backup_path = config_path.with_suffix(f".bak.{timestamp}")
-    backup_path.write_text(config_path.read_text(encoding="utf-8"), encoding="utf-8")
-    config_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    try:
+        # The new config is swapped in with a rename, so the link keeps the old contents.
+        os.link(config_path, backup_path)
+    except OSError:
+        backup_path.write_text(text, encoding="utf-8")
+    tmp_path = config_path.with_suffix(".tmp")
+    tmp_path.write_text(yaml.dump(payload, Dumper=YamlDumper, sort_keys=False), encoding="utf-8")
+    os.replace(tmp_path, config_path)
     return backup_path
 
 
@@ -142,8 +179,9 @@ def _resolve_sqlite_path(sqlite_path_raw: Any, config_path: Path) -> Path | None
     workspace_dir = config_path.parent
     if raw_path.parts and raw_path.parts[0] == WORKSPACES_DIR.name:
         # Backward-compat: allow paths that already include "workspaces/..." from repo root.
-        return (workspace_dir.parent.parent / raw_path).resolve()
-    return (workspace_dir / raw_path).resolve()
+        return Path(os.path.abspath(workspace_dir.parent.parent / raw_path))
+    # abspath normalizes lexically; symlinks need no resolving for a local database path.
+    return Path(os.path.abspath(workspace_dir / raw_path))
 
 
 def _parse_mirror(mirror_data: Any) -> MirrorConfig | None:
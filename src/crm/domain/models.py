@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Organization:
     org_id: str
     name: str
@@ -16,7 +16,7 @@ class Organization:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Person:
     person_id: str
     org_id: str | None
@@ -30,7 +30,7 @@ class Person:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SponsorOpp:
     opp_id: str
     org_id: str
@@ -48,7 +48,7 @@ class SponsorOpp:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Campaign:
     campaign_id: str
     name: str
@@ -60,7 +60,7 @@ class Campaign:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CampaignMember:
     member_id: str
     campaign_id: str
@@ -76,7 +76,7 @@ class CampaignMember:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Touch:
     touch_id: str
     occurred_at: datetime
@@ -94,7 +94,7 @@ class Touch:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     task_id: str
     due_at: datetime | None
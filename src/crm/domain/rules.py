@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection
 from datetime import date, datetime
 
 
@@ -13,7 +13,7 @@ def require(value: str | None, field: str) -> None:
         raise ValidationError(f"{field} is required.")
 
 
-def validate_enum(value: str | None, allowed: Iterable[str], field: str) -> None:
+def validate_enum(value: str | None, allowed: Collection[str], field: str) -> None:
     if value is None:
         return
     if value not in allowed:
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cache
 
 
-class SponsorStage(str, Enum):
+class ChoiceEnum(str, Enum):
+    @classmethod
+    @cache
+    def values(cls) -> tuple[str, ...]:
+        return tuple(member.value for member in cls)
+
+
+class SponsorStage(ChoiceEnum):
     TARGETED = "targeted"
     CONTACT_FOUND = "contact_found"
     CONTACTED = "contacted"
@@ -17,20 +25,20 @@ class SponsorStage(str, Enum):
     CLOSED_LOST = "closed_lost"
 
 
-class SponsorTier(str, Enum):
+class SponsorTier(ChoiceEnum):
     PLATINUM = "platinum"
     GOLD = "gold"
     SILVER = "silver"
     OTHER = "other"
 
 
-class CampaignKind(str, Enum):
+class CampaignKind(ChoiceEnum):
     ATTENDEE_OUTREACH = "attendee_outreach"
     SPEAKER_OUTREACH = "speaker_outreach"
     OTHER = "other"
 
 
-class CampaignMemberStatus(str, Enum):
+class CampaignMemberStatus(ChoiceEnum):
     IDENTIFIED = "identified"
     INVITED = "invited"
     INTERESTED = "interested"
@@ -40,7 +48,7 @@ class CampaignMemberStatus(str, Enum):
     UNRESPONSIVE = "unresponsive"
 
 
-class TouchChannel(str, Enum):
+class TouchChannel(ChoiceEnum):
     EMAIL = "email"
     CALL = "call"
     MEETING = "meeting"
@@ -48,12 +56,21 @@ class TouchChannel(str, Enum):
     OTHER = "other"
 
 
-class TouchDirection(str, Enum):
+class TouchDirection(ChoiceEnum):
     OUTBOUND = "outbound"
     INBOUND = "inbound"
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(ChoiceEnum):
     OPEN = "open"
     DONE = "done"
     CANCELED = "canceled"
+
+
+SPONSOR_STAGE_VALUES = frozenset(SponsorStage.values())
+SPONSOR_TIER_VALUES = frozenset(SponsorTier.values())
+CAMPAIGN_KIND_VALUES = frozenset(CampaignKind.values())
+CAMPAIGN_MEMBER_STATUS_VALUES = frozenset(CampaignMemberStatus.values())
+TOUCH_CHANNEL_VALUES = frozenset(TouchChannel.values())
+TOUCH_DIRECTION_VALUES = frozenset(TouchDirection.values())
+TASK_STATUS_VALUES = frozenset(TaskStatus.values())
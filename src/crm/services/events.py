@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from crm.services.utils import utc_now_iso
+
+FLUSH_EVERY = 256
+
+# Bound once: json.dumps re-checks its keyword arguments on every call.
+_encode = json.JSONEncoder().encode
+
 
 @dataclass
 class EventLogger:
     path: Path
     workspace: str
     enabled: bool = True
+    _pending: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __enter__(self) -> EventLogger:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
 
     def log(
         self,
@@ -21,11 +34,12 @@ class EventLogger:
         external_id: str,
         changed_fields: Iterable[str] | None = None,
         conflict: bool = False,
+        ts: str | None = None,
     ) -> None:
         if not self.enabled:
             return
         payload = {
-            "ts": datetime.now(UTC).replace(microsecond=0).isoformat(),
+            "ts": ts or utc_now_iso(),
             "workspace": self.workspace,
             "entity_type": entity_type,
             "external_id": external_id,
@@ -33,6 +47,14 @@ class EventLogger:
             "changed_fields": list(changed_fields or []),
             "conflict": conflict,
         }
+        self._pending.append(_encode(payload))
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+            handle.write("\n".join(self._pending) + "\n")
+        self._pending.clear()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import csv
+import sqlite3
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from openpyxl import Workbook
-
-from crm.store.sqlite import SqliteStore
+from crm.store.sqlite import READ_POOL_SIZE, SqliteStore
 
 TABLES = [
     "organizations",
@@ -20,39 +20,43 @@ TABLES = [
 
 
 def export_excel(store: SqliteStore, out_path: Path) -> None:
+    from openpyxl import Workbook
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    wb = Workbook()
-    wb.remove(wb.active)
+    wb = Workbook(write_only=True)
 
     for table in TABLES:
-        rows = store.fetch_all(f"SELECT * FROM {table}")
         ws = wb.create_sheet(title=table)
-        _write_sheet(ws, rows)
+        with store.iter_rows(f"SELECT * FROM {table}") as cur:
+            _write_sheet(ws, _headers(cur), cur)
 
     wb.save(out_path)
 
 
 def export_csv_tables(store: SqliteStore, out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    for table in TABLES:
-        rows = store.fetch_all(f"SELECT * FROM {table}")
-        if not rows:
-            headers: list[str] = []
-        else:
-            headers = list(rows[0].keys())
-        csv_path = out_dir / f"{table}.csv"
-        with csv_path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(headers)
-            for row in rows:
-                writer.writerow([row[h] for h in headers])
-
-
-def _write_sheet(ws, rows: Iterable) -> None:
-    rows = list(rows)
-    if not rows:
-        return
-    headers = list(rows[0].keys())
-    ws.append(headers)
+    # Each table goes to its own file over its own pooled read connection.
+    with ThreadPoolExecutor(max_workers=min(READ_POOL_SIZE, len(TABLES))) as executor:
+        list(executor.map(lambda table: _export_csv_table(store, table, out_dir), TABLES))
+
+
+def _export_csv_table(store: SqliteStore, table: str, out_dir: Path) -> None:
+    csv_path = out_dir / f"{table}.csv"
+    with (
+        store.iter_rows(f"SELECT * FROM {table}") as cur,
+        csv_path.open("w", newline="", encoding="utf-8") as handle,
+    ):
+        writer = csv.writer(handle)
+        writer.writerow(_headers(cur))
+        writer.writerows(cur)
+
+
+def _headers(cur: sqlite3.Cursor) -> list[str]:
+    return [column[0] for column in cur.description]
+
+
+def _write_sheet(ws, headers: list[str], rows: Iterable) -> None:
+    append = ws.append
+    append(headers)
     for row in rows:
-        ws.append([row[h] for h in headers])
+        append(row)
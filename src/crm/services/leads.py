@@ -3,22 +3,49 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date
-from typing import Protocol
 from uuid import uuid4
 
 from crm.domain import rules
-from crm.domain.stages import CampaignKind, CampaignMemberStatus, SponsorStage, SponsorTier
+from crm.domain.stages import (
+    CAMPAIGN_MEMBER_STATUS_VALUES,
+    SPONSOR_STAGE_VALUES,
+    SPONSOR_TIER_VALUES,
+    CampaignKind,
+)
 from crm.services.utils import parse_contact, utc_now_iso
-from crm.store.sqlite import SqliteStore
+from crm.store.sqlite import SqliteSession, SqliteStore
 
+_INSERT_ORG_SQL = (
+    "INSERT INTO organizations (org_id, name, domain, org_type, tags, notes, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_PERSON_SQL = (
+    "INSERT INTO people (person_id, org_id, full_name, email, title, linkedin_url, tags, notes, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_SPONSOR_OPP_SQL = (
+    "INSERT INTO sponsor_opps (opp_id, org_id, primary_person_id, stage, expected_value_usd, tier, "
+    "probability, next_action, next_action_due, last_touch_at, last_touch_channel, notes, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# SQLite's default cap on bound parameters is far above this; keeps IN (...) lists modest.
+_IN_CHUNK_SIZE = 500
 
-class _StoreLike(Protocol):
-    def execute(self, query: str, params: Iterable[object] | None = None) -> None: ...
 
-    def fetch_one(self, query: str, params: Iterable[object] | None = None): ...
+@dataclass(frozen=True)
+class SponsorLeadInput:
+    org_name: str
+    stage: str
+    domain: str | None = None
+    contact: str | None = None
+    value: float | None = None
+    tier: str | None = None
+    next_action: str | None = None
+    due: date | None = None
+    notes: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LeadNextItem:
     pipeline: str
     record_id: str
@@ -27,6 +54,25 @@ class LeadNextItem:
     next_action_due: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class SponsorLeadRow:
+    opp_id: str
+    org_name: str
+    stage: str
+    next_action: str | None
+    next_action_due: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class AttendeeLeadRow:
+    member_id: str
+    campaign_name: str
+    full_name: str
+    status: str
+    next_action: str | None
+    next_action_due: str | None
+
+
 def add_sponsor_lead(
     store: SqliteStore,
     org_name: str,
@@ -40,12 +86,12 @@ def add_sponsor_lead(
     notes: str | None,
 ) -> str:
     rules.require(org_name, "org")
-    rules.validate_enum(stage, [s.value for s in SponsorStage], "stage")
+    rules.validate_enum(stage, SPONSOR_STAGE_VALUES, "stage")
     if tier:
-        rules.validate_enum(tier, [t.value for t in SponsorTier], "tier")
+        rules.validate_enum(tier, SPONSOR_TIER_VALUES, "tier")
 
     now = utc_now_iso()
-    with store.session() as session:
+    with store.session(immediate=True) as session:
         org_id = _get_or_create_org(session, org_name, domain, now)
 
         person_id = None
@@ -55,29 +101,90 @@ def add_sponsor_lead(
 
         opp_id = str(uuid4())
         session.execute(
-            "INSERT INTO sponsor_opps (opp_id, org_id, primary_person_id, stage, expected_value_usd, tier, "
-            "probability, next_action, next_action_due, last_touch_at, last_touch_channel, notes, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                opp_id,
-                org_id,
-                person_id,
-                stage,
-                value,
-                tier,
-                None,
-                next_action,
-                due.isoformat() if due else None,
-                None,
-                None,
-                notes,
-                now,
-                now,
+            _INSERT_SPONSOR_OPP_SQL,
+            _sponsor_opp_params(
+                opp_id, org_id, person_id, stage, value, tier, next_action, due, notes, now
             ),
         )
         return opp_id
 
 
+def add_sponsor_leads_bulk(store: SqliteStore, items: Iterable[SponsorLeadInput]) -> list[str]:
+    items = list(items)
+    for item in items:
+        rules.require(item.org_name, "org")
+        rules.validate_enum(item.stage, SPONSOR_STAGE_VALUES, "stage")
+        if item.tier:
+            rules.validate_enum(item.tier, SPONSOR_TIER_VALUES, "tier")
+    contacts = [parse_contact(item.contact) if item.contact else None for item in items]
+
+    now = utc_now_iso()
+    org_rows: list[tuple[object, ...]] = []
+    person_rows: list[tuple[object, ...]] = []
+    opp_rows: list[tuple[object, ...]] = []
+    opp_ids: list[str] = []
+    with store.session(immediate=True) as session:
+        orgs_by_domain, orgs_by_name = _prefetch_keys(
+            session,
+            "organizations",
+            "org_id",
+            ("domain", {item.domain for item in items if item.domain}),
+            ("name", {item.org_name for item in items}),
+        )
+        people_by_email, people_by_name = _prefetch_keys(
+            session,
+            "people",
+            "person_id",
+            ("email", {contact[1] for contact in contacts if contact and contact[1]}),
+            ("full_name", {contact[0] for contact in contacts if contact}),
+        )
+        for item, contact in zip(items, contacts, strict=True):
+            org_id = (item.domain and orgs_by_domain.get(item.domain)) or orgs_by_name.get(
+                item.org_name
+            )
+            if org_id is None:
+                org_id = str(uuid4())
+                org_rows.append((org_id, item.org_name, item.domain, None, None, None, now, now))
+                orgs_by_name[item.org_name] = org_id
+                if item.domain:
+                    orgs_by_domain[item.domain] = org_id
+
+            person_id = None
+            if contact:
+                name, email = contact
+                person_id = (email and people_by_email.get(email)) or people_by_name.get(name)
+                if person_id is None:
+                    person_id = str(uuid4())
+                    person_rows.append(
+                        (person_id, org_id, name, email, None, None, None, None, now, now)
+                    )
+                    people_by_name[name] = person_id
+                    if email:
+                        people_by_email[email] = person_id
+
+            opp_id = str(uuid4())
+            opp_ids.append(opp_id)
+            opp_rows.append(
+                _sponsor_opp_params(
+                    opp_id,
+                    org_id,
+                    person_id,
+                    item.stage,
+                    item.value,
+                    item.tier,
+                    item.next_action,
+                    item.due,
+                    item.notes,
+                    now,
+                )
+            )
+
+        session.executemany(_INSERT_ORG_SQL, org_rows)
+        session.executemany(_INSERT_PERSON_SQL, person_rows)
+        session.executemany(_INSERT_SPONSOR_OPP_SQL, opp_rows)
+    return opp_ids
+
+
 def add_attendee_lead(
     store: SqliteStore,
     campaign_name: str,
@@ -90,10 +197,10 @@ def add_attendee_lead(
 ) -> str:
     rules.require(campaign_name, "campaign")
     rules.require(person, "person")
-    rules.validate_enum(status, [s.value for s in CampaignMemberStatus], "status")
+    rules.validate_enum(status, CAMPAIGN_MEMBER_STATUS_VALUES, "status")
 
     now = utc_now_iso()
-    with store.session() as session:
+    with store.session(immediate=True) as session:
         campaign_id = _get_or_create_campaign(session, campaign_name, now)
         person_name, email = parse_contact(person)
         person_id = _get_or_create_person(session, None, person_name, email, now)
@@ -121,7 +228,7 @@ def add_attendee_lead(
         return member_id
 
 
-def list_sponsor_leads(store: SqliteStore, stage: str | None) -> list[dict[str, str]]:
+def list_sponsor_leads(store: SqliteStore, stage: str | None) -> list[SponsorLeadRow]:
     params: list[str] = []
     where = ""
     if stage:
@@ -134,10 +241,10 @@ def list_sponsor_leads(store: SqliteStore, stage: str | None) -> list[dict[str,
         f"{where} ORDER BY sponsor_opps.updated_at DESC"
     )
     rows = store.fetch_all(query, params)
-    return [dict(row) for row in rows]
+    return [SponsorLeadRow(*row) for row in rows]
 
 
-def list_attendee_leads(store: SqliteStore, status: str | None) -> list[dict[str, str]]:
+def list_attendee_leads(store: SqliteStore, status: str | None) -> list[AttendeeLeadRow]:
     params: list[str] = []
     where = ""
     if status:
@@ -152,7 +259,7 @@ def list_attendee_leads(store: SqliteStore, status: str | None) -> list[dict[str
         f"{where} ORDER BY campaign_members.updated_at DESC"
     )
     rows = store.fetch_all(query, params)
-    return [dict(row) for row in rows]
+    return [AttendeeLeadRow(*row) for row in rows]
 
 
 def next_actions(store: SqliteStore, limit: int = 10) -> list[LeadNextItem]:
@@ -169,60 +276,99 @@ def next_actions(store: SqliteStore, limit: int = 10) -> list[LeadNextItem]:
         "ORDER BY next_action_due ASC LIMIT ?"
     )
     rows = store.fetch_all(query, (limit,))
-    return [
-        LeadNextItem(
-            pipeline=row["pipeline"],
-            record_id=row["record_id"],
-            org_or_person=row["name"],
-            next_action=row["next_action"],
-            next_action_due=row["next_action_due"],
-        )
-        for row in rows
-    ]
+    return [LeadNextItem(*row) for row in rows]
+
+
+def _sponsor_opp_params(
+    opp_id: str,
+    org_id: str,
+    person_id: str | None,
+    stage: str,
+    value: float | None,
+    tier: str | None,
+    next_action: str | None,
+    due: date | None,
+    notes: str | None,
+    now: str,
+) -> tuple[object, ...]:
+    return (
+        opp_id,
+        org_id,
+        person_id,
+        stage,
+        value,
+        tier,
+        None,
+        next_action,
+        due.isoformat() if due else None,
+        None,
+        None,
+        notes,
+        now,
+        now,
+    )
+
 
+def _prefetch_keys(
+    session: SqliteSession,
+    table: str,
+    id_field: str,
+    *keys: tuple[str, set[str]],
+) -> list[dict[str, str]]:
+    found: list[dict[str, str]] = []
+    for column, values in keys:
+        by_value: dict[str, str] = {}
+        ordered = sorted(values)
+        for start in range(0, len(ordered), _IN_CHUNK_SIZE):
+            chunk = ordered[start : start + _IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = session.fetch_all(
+                f"SELECT {column}, {id_field} FROM {table} WHERE {column} IN ({placeholders})",
+                chunk,
+            )
+            for row in rows:
+                by_value.setdefault(row[column], row[id_field])
+        found.append(by_value)
+    return found
 
-def _get_or_create_org(store: _StoreLike, name: str, domain: str | None, now: str) -> str:
-    if domain:
-        row = store.fetch_one("SELECT org_id FROM organizations WHERE domain = ?", (domain,))
-        if row:
-            return row["org_id"]
-    row = store.fetch_one("SELECT org_id FROM organizations WHERE name = ?", (name,))
+
+def _get_or_create_org(session: SqliteSession, name: str, domain: str | None, now: str) -> str:
+    # One lookup for both keys; a domain match wins over a name match.
+    row = session.fetch_one(
+        "SELECT org_id FROM organizations WHERE domain = ? OR name = ? "
+        "ORDER BY CASE WHEN domain = ? THEN 0 ELSE 1 END LIMIT 1",
+        (domain, name, domain),
+    )
     if row:
         return row["org_id"]
     org_id = str(uuid4())
-    store.execute(
-        "INSERT INTO organizations (org_id, name, domain, org_type, tags, notes, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        (org_id, name, domain, None, None, None, now, now),
-    )
+    session.execute(_INSERT_ORG_SQL, (org_id, name, domain, None, None, None, now, now))
     return org_id
 
 
 def _get_or_create_person(
-    store: _StoreLike, org_id: str | None, name: str, email: str | None, now: str
+    session: SqliteSession, org_id: str | None, name: str, email: str | None, now: str
 ) -> str:
-    if email:
-        row = store.fetch_one("SELECT person_id FROM people WHERE email = ?", (email,))
-        if row:
-            return row["person_id"]
-    row = store.fetch_one("SELECT person_id FROM people WHERE full_name = ?", (name,))
+    row = session.fetch_one(
+        "SELECT person_id FROM people WHERE email = ? OR full_name = ? "
+        "ORDER BY CASE WHEN email = ? THEN 0 ELSE 1 END LIMIT 1",
+        (email, name, email),
+    )
     if row:
         return row["person_id"]
     person_id = str(uuid4())
-    store.execute(
-        "INSERT INTO people (person_id, org_id, full_name, email, title, linkedin_url, tags, notes, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        (person_id, org_id, name, email, None, None, None, None, now, now),
+    session.execute(
+        _INSERT_PERSON_SQL, (person_id, org_id, name, email, None, None, None, None, now, now)
     )
     return person_id
 
 
-def _get_or_create_campaign(store: _StoreLike, name: str, now: str) -> str:
-    row = store.fetch_one("SELECT campaign_id FROM campaigns WHERE name = ?", (name,))
+def _get_or_create_campaign(session: SqliteSession, name: str, now: str) -> str:
+    row = session.fetch_one("SELECT campaign_id FROM campaigns WHERE name = ?", (name,))
     if row:
         return row["campaign_id"]
     campaign_id = str(uuid4())
-    store.execute(
+    session.execute(
         "INSERT INTO campaigns (campaign_id, name, kind, start_date, end_date, notes, created_at, updated_at) "
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
         (campaign_id, name, CampaignKind.ATTENDEE_OUTREACH.value, None, None, None, now, now),
@@ -3,20 +3,15 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
-from crm.adapters.airtable.client import AirtableClient, AirtableError
-from crm.adapters.airtable.mirror import load_mapping
-from crm.adapters.airtable.schema import (
-    BootstrapResult,
-    DoctorResult,
-    bootstrap,
-    configure_modified_time_fields,
-    doctor,
-)
+from typing import TYPE_CHECKING, Any
+
 from crm.config import MirrorConfig, WorkspaceConfig
 from crm.store.migrations import load_schema
 
+if TYPE_CHECKING:
+    from crm.adapters.airtable.client import AirtableClient
+    from crm.adapters.airtable.schema import BootstrapResult, DoctorResult
+
 
 class MirrorServiceError(RuntimeError):
     pass
@@ -58,8 +53,14 @@ def _require_airtable_config(mirror: MirrorConfig) -> None:
 
 
 def _client(mirror: MirrorConfig) -> AirtableClient:
+    from crm.adapters.airtable.client import AirtableClient, default_cache_dir
+
     api_key = _require_api_key()
-    return AirtableClient(api_key=api_key, base_id=mirror.base_id or "")
+    return AirtableClient(
+        api_key=api_key,
+        base_id=mirror.base_id or "",
+        metadata_cache_dir=default_cache_dir(),
+    )
 
 
 def doctor_airtable(
@@ -68,6 +69,10 @@ def doctor_airtable(
     schema_path: Path,
     include_modified_time: bool = True,
 ) -> MirrorDoctorResult:
+    from crm.adapters.airtable.client import AirtableError
+    from crm.adapters.airtable.mirror import load_mapping
+    from crm.adapters.airtable.schema import doctor
+
     if workspace.mirror is None:
         raise MirrorServiceError("Workspace mirror config is missing.")
     _require_airtable_config(workspace.mirror)
@@ -102,6 +107,10 @@ def bootstrap_airtable(
     apply: bool,
     include_modified_time: bool = True,
 ) -> MirrorBootstrapResult:
+    from crm.adapters.airtable.client import AirtableError
+    from crm.adapters.airtable.mirror import load_mapping
+    from crm.adapters.airtable.schema import bootstrap, configure_modified_time_fields
+
     if workspace.mirror is None:
         raise MirrorServiceError("Workspace mirror config is missing.")
     _require_airtable_config(workspace.mirror)
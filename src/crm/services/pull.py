@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 EXCLUDED_FIELDS = {"created_at", "updated_at"}
+_PLAIN_SCALARS = (str, int, float)
 
 
 @dataclass(frozen=True)
@@ -14,21 +17,52 @@ class PullDecision:
     reason: str | None = None
 
 
+# (local_field, airtable_field, field_type)
+DiffPlan = list[tuple[str, str, str | None]]
+
+
 def diff_fields(
     *,
     local_row: dict[str, Any] | None,
     remote_fields: dict[str, Any],
     field_map: dict[str, str],
     schema_fields: dict[str, Any],
+) -> list[str]:
+    return diff_planned_fields(
+        local_row=local_row,
+        remote_fields=remote_fields,
+        plan=build_diff_plan(field_map, schema_fields),
+    )
+
+
+def build_diff_plan(field_map: dict[str, str], schema_fields: dict[str, Any]) -> DiffPlan:
+    return [
+        (local_field, airtable_field, (schema_fields.get(local_field) or {}).get("type"))
+        for local_field, airtable_field in field_map.items()
+        if local_field not in EXCLUDED_FIELDS
+    ]
+
+
+def diff_planned_fields(
+    *,
+    local_row: dict[str, Any] | None,
+    remote_fields: dict[str, Any],
+    plan: DiffPlan,
 ) -> list[str]:
     changed: list[str] = []
-    for local_field, airtable_field in field_map.items():
-        if local_field in EXCLUDED_FIELDS:
-            continue
-        spec = schema_fields.get(local_field) or {}
-        field_type = spec.get("type")
+    for local_field, airtable_field, field_type in plan:
         local_value = local_row.get(local_field) if local_row else None
         remote_value = remote_fields.get(airtable_field)
+        # Sparse Airtable records leave most fields absent; nothing to normalize.
+        if local_value is None and remote_value is None:
+            continue
+        # Identical scalars normalize identically, so skip the conversion work.
+        if (
+            type(local_value) is type(remote_value)
+            and type(local_value) in _PLAIN_SCALARS
+            and local_value == remote_value
+        ):
+            continue
         if not _values_equal(local_value, remote_value, field_type):
             changed.append(local_field)
     return changed
@@ -82,29 +116,40 @@ def _normalize_value(value: Any, field_type: str | None) -> Any:
     if value is None or value == "":
         return None
     if isinstance(value, list):
-        normalized = [_normalize_value(item, field_type) for item in value]
-        return tuple(str(item) for item in normalized if item is not None)
+        return _normalize_sequence(value, field_type)
     if isinstance(value, dict):
         if "name" in value:
             return str(value.get("name"))
         return str(value)
+    return _NORMALIZERS.get(field_type, str)(value)
 
-    if field_type in {"uuid", "text", "enum"}:
+
+def _normalize_sequence(values: list[Any], field_type: str | None) -> tuple[str, ...]:
+    normalize = _NORMALIZERS.get(field_type, str)
+    normalized: list[str] = []
+    for item in values:
+        if item is None or item == "":
+            continue
+        if isinstance(item, (list, dict)):
+            item = _normalize_value(item, field_type)
+        else:
+            item = normalize(item)
+        if item is not None:
+            normalized.append(str(item))
+    return tuple(normalized)
+
+
+def _number_or_text(value: Any) -> float | str:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
         return str(value)
-    if field_type == "number":
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return str(value)
-    if field_type == "bool":
-        if isinstance(value, str):
-            return value.lower() in {"true", "1", "yes"}
-        return bool(value)
-    if field_type == "date":
-        return _parse_date(value)
-    if field_type == "datetime":
-        return _parse_datetime(value)
-    return str(value)
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in {"true", "1", "yes"}
+    return bool(value)
 
 
 def _parse_date(value: Any) -> date | None:
@@ -115,27 +160,37 @@ def _parse_date(value: Any) -> date | None:
     if isinstance(value, datetime):
         return value.date()
     if isinstance(value, str):
-        try:
-            return date.fromisoformat(value.split("T")[0])
-        except ValueError:
-            return None
+        return _parse_date_text(value)
     return None
 
 
+@lru_cache(maxsize=8192)
+def _parse_date_text(value: str) -> date | None:
+    try:
+        return date.fromisoformat(value.split("T")[0])
+    except ValueError:
+        return None
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     if value is None:
         return None
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        cleaned = value.replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(cleaned)
-        except ValueError:
-            return None
+        return _parse_datetime_text(value)
     return None
 
 
+# Timestamps repeat heavily across pulled rows (mirror and modified times), so parse each once.
+@lru_cache(maxsize=8192)
+def _parse_datetime_text(value: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 def has_remote_changes(
     remote_modified_at: datetime | str | None,
     mirror_state: dict[str, Any] | None,
@@ -151,3 +206,14 @@ def has_remote_changes(
     if mirror_updated_at is None:
         return True
     return remote_dt > mirror_updated_at
+
+
+_NORMALIZERS: dict[str | None, Callable[[Any], Any]] = {
+    "uuid": str,
+    "text": str,
+    "enum": str,
+    "number": _number_or_text,
+    "bool": _truthy,
+    "date": _parse_date,
+    "datetime": _parse_datetime,
+}
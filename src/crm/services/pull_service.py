@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from crm.adapters.airtable.client import AirtableClient, AirtableError
-from crm.adapters.airtable.mirror import load_mapping
-from crm.adapters.airtable.pull import PullChange, PullError, PullSummary, pull_records
 from crm.config import MirrorConfig
 from crm.services.events import EventLogger
 from crm.services.sync_state import load_sync_state, save_sync_state
@@ -12,6 +10,9 @@ from crm.services.utils import utc_now_iso
 from crm.store.migrations import load_schema
 from crm.store.sqlite import SqliteStore
 
+if TYPE_CHECKING:
+    from crm.adapters.airtable.pull import PullChange, PullSummary
+
 
 class PullServiceError(RuntimeError):
     pass
@@ -46,14 +47,25 @@ def pull(
     accept_remote: set[str] | None = None,
     logger: EventLogger | None = None,
 ) -> tuple[PullSummary, list[PullChange]]:
+    from crm.adapters.airtable.client import AirtableClient, AirtableError, default_cache_dir
+    from crm.adapters.airtable.mirror import load_mapping
+    from crm.adapters.airtable.pull import PullError, pull_records
+
     _require_airtable_config(mirror)
     api_key = _require_api_key()
-    client = AirtableClient(api_key=api_key, base_id=mirror.base_id or "")
+    client = AirtableClient(
+        api_key=api_key,
+        base_id=mirror.base_id or "",
+        metadata_cache_dir=default_cache_dir(),
+    )
     mapping = load_mapping(mapping_path)
     schema = load_schema(schema_path)
     state = load_sync_state(workspace_path)
     try:
-        tables_meta = {table["id"]: table for table in client.list_tables()}
+        wanted_ids = {table_id for table_id in mirror.tables.values() if table_id}
+        tables_meta = {
+            table["id"]: table for table in client.list_tables() if table["id"] in wanted_ids
+        }
         summary, changes = pull_records(
             store,
             client,
@@ -78,9 +90,7 @@ def pull(
 
     if apply and summary.conflicts == 0:
         now = utc_now_iso()
-        state.last_pull_at = {**state.last_pull_at}
-        for table_name in mapping.tables:
-            state.last_pull_at[table_name] = now
+        state.last_pull_at.update(dict.fromkeys(mapping.tables, now))
         save_sync_state(workspace_path, state)
 
     return summary, changes
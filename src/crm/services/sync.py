@@ -3,9 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from crm.adapters.airtable.client import AirtableClient
-from crm.adapters.airtable.mirror import load_mapping, push_all, validate_schema
-from crm.config import MirrorConfig
+from crm.config import SCHEMA_PATH, MirrorConfig
 from crm.services.events import EventLogger
 from crm.store.migrations import load_schema
 from crm.store.sqlite import SqliteStore
@@ -39,20 +37,40 @@ def push(
     validate: bool = True,
     logger: EventLogger | None = None,
 ) -> None:
+    from crm.adapters.airtable.client import (
+        RESPONSE_CACHE_TTL_SECONDS,
+        AirtableClient,
+        default_cache_dir,
+    )
+    from crm.adapters.airtable.mirror import load_mapping, push_all, validate_schema
+
     _require_airtable_config(mirror)
     api_key = _require_api_key()
-    client = AirtableClient(api_key=api_key, base_id=mirror.base_id or "")
+    # Validation and the push lookups repeat the same GETs; the push's writes clear the cache.
+    client = AirtableClient(
+        api_key=api_key,
+        base_id=mirror.base_id or "",
+        metadata_cache_dir=default_cache_dir(),
+        response_cache_ttl=RESPONSE_CACHE_TTL_SECONDS,
+    )
     mapping = load_mapping(mapping_path)
     if validate:
-        schema = load_schema(Path("resources/schema/canonical.yaml"))
+        schema = load_schema(SCHEMA_PATH)
         validate_schema(client, mapping, schema, mirror.tables, include_modified_time=False)
     push_all(store, client, mapping, mirror.tables, logger=logger)
 
 
 def validate_mirror(store: SqliteStore, mirror: MirrorConfig, mapping_path: Path) -> None:
+    from crm.adapters.airtable.client import AirtableClient, default_cache_dir
+    from crm.adapters.airtable.mirror import load_mapping, validate_schema
+
     _require_airtable_config(mirror)
     api_key = _require_api_key()
-    client = AirtableClient(api_key=api_key, base_id=mirror.base_id or "")
+    client = AirtableClient(
+        api_key=api_key,
+        base_id=mirror.base_id or "",
+        metadata_cache_dir=default_cache_dir(),
+    )
     mapping = load_mapping(mapping_path)
-    schema = load_schema(Path("resources/schema/canonical.yaml"))
+    schema = load_schema(SCHEMA_PATH)
     validate_schema(client, mapping, schema, mirror.tables, include_modified_time=False)
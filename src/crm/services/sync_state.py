@@ -20,19 +20,28 @@ def load_sync_state(workspace_path: Path) -> SyncState:
     path = workspace_path / SYNC_STATE_FILE
     if not path.exists():
         return SyncState(last_pull_at={}, last_push_at=None)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(path.read_bytes())
     last_pull_at = data.get("last_pull_at") or {}
     last_push_at = data.get("last_push_at")
     schema_fingerprint = data.get("schema_fingerprint")
     if not isinstance(last_pull_at, dict):
         last_pull_at = {}
+    # JSON keys are always strings; only rebuild when a value needs coercing.
+    if any(type(value) is not str for value in last_pull_at.values()):
+        last_pull_at = {key: str(value) for key, value in last_pull_at.items()}
     return SyncState(
-        last_pull_at={str(k): str(v) for k, v in last_pull_at.items()},
-        last_push_at=str(last_push_at) if last_push_at else None,
-        schema_fingerprint=str(schema_fingerprint) if schema_fingerprint else None,
+        last_pull_at=last_pull_at,
+        last_push_at=_optional_text(last_push_at),
+        schema_fingerprint=_optional_text(schema_fingerprint),
     )
 
 
+def _optional_text(value: Any) -> str | None:
+    if not value:
+        return None
+    return value if type(value) is str else str(value)
+
+
 def save_sync_state(workspace_path: Path, state: SyncState) -> None:
     path = workspace_path / SYNC_STATE_FILE
     payload: dict[str, Any] = {
@@ -41,4 +50,4 @@ def save_sync_state(workspace_path: Path, state: SyncState) -> None:
     }
     if state.schema_fingerprint:
         payload["schema_fingerprint"] = state.schema_fingerprint
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_bytes(json.dumps(payload, indent=2, sort_keys=True).encode("utf-8") + b"\n")
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-import re
 from datetime import UTC, date, datetime
 
-CONTACT_RE = re.compile(r"^(?P<name>[^<]+?)(?:\s*<(?P<email>[^>]+)>)?$")
-
 
 def utc_now_iso() -> str:
-    return datetime.now(UTC).replace(microsecond=0).isoformat()
+    return datetime.now(UTC).isoformat(timespec="seconds")
 
 
 def today_iso() -> str:
@@ -15,12 +12,15 @@ def today_iso() -> str:
 
 
 def parse_contact(contact: str) -> tuple[str, str | None]:
-    match = CONTACT_RE.match(contact.strip())
-    if not match:
-        return contact.strip(), None
-    name = match.group("name").strip()
-    email = match.group("email")
-    return name, email.strip() if email else None
+    # Accepts "Name" or "Name <email>"; anything else is kept whole as the name.
+    text = contact.strip()
+    head, bracket, rest = text.partition("<")
+    if not bracket:
+        return text, None
+    email = rest[:-1]
+    if not head or not rest.endswith(">") or not email or ">" in email:
+        return text, None
+    return head.strip(), email.strip()
 
 
 def normalize_tags(tags: list[str] | None) -> str | None:
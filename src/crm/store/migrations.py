@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as YamlLoader
+
 TYPE_MAP = {
     "uuid": "TEXT",
     "text": "TEXT",
@@ -29,7 +40,13 @@ class SchemaError(RuntimeError):
 
 
 def load_schema(schema_path: Path) -> Schema:
-    data = yaml.safe_load(schema_path.read_text(encoding="utf-8")) or {}
+    stat = schema_path.stat()
+    return _load_schema_cached(str(schema_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_schema_cached(path: str, mtime_ns: int, size: int) -> Schema:
+    data = read_yaml(Path(path)) or {}
     version = data.get("version", 1)
     enums = data.get("enums", {})
     tables = data.get("tables", {})
@@ -38,25 +55,62 @@ def load_schema(schema_path: Path) -> Schema:
     return Schema(version=version, enums=enums, tables=tables)
 
 
+def read_yaml(path: Path) -> Any:
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    cache_path = path.with_name(f"{path.name}.cache.json")
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+    if isinstance(cached, dict) and cached.get("hash") == digest:
+        return cached.get("data")
+
+    data = yaml.load(raw.decode("utf-8"), Loader=YamlLoader)
+    try:
+        encoded = json.dumps({"hash": digest, "data": data})
+    except (TypeError, ValueError):
+        return data
+    # Only keep the sidecar if JSON round-trips the document exactly (no dates, non-str keys).
+    if json.loads(encoded)["data"] == data:
+        with contextlib.suppress(OSError):
+            cache_path.write_text(encoded, encoding="utf-8")
+    return data
+
+
 def apply_schema(conn, schema_path: Path) -> None:
-    schema = load_schema(schema_path)
+    stat = schema_path.stat()
+    # foreign_keys cannot change inside a transaction, so set it before the script's BEGIN.
     conn.execute("PRAGMA foreign_keys = ON;")
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS __schema_meta (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
-    )
-
+    try:
+        conn.executescript(_schema_script(str(schema_path), stat.st_mtime_ns, stat.st_size))
+    except sqlite3.Error:
+        # executescript stops at the failing statement, leaving the script's BEGIN open.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+@lru_cache(maxsize=8)
+def _schema_script(path: str, mtime_ns: int, size: int) -> str:
+    schema = _load_schema_cached(path, mtime_ns, size)
+    statements = [
+        "BEGIN;",
+        "CREATE TABLE IF NOT EXISTS __schema_meta "
+        "(version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL);",
+    ]
     for table_name, table_def in schema.tables.items():
-        _create_table(conn, table_name, table_def)
-        _create_indexes(conn, table_name, table_def)
-
-    conn.execute(
-        "INSERT OR REPLACE INTO __schema_meta (version, applied_at) VALUES (?, datetime('now'))",
-        (schema.version,),
+        statements.append(_table_sql(table_name, table_def))
+        statements.extend(_index_sql(table_name, table_def))
+    statements.append(
+        "INSERT OR REPLACE INTO __schema_meta (version, applied_at) "
+        f"VALUES ({int(schema.version)}, datetime('now'));"
     )
-    conn.commit()
+    statements.append("COMMIT;")
+    return "\n".join(statements)
 
 
-def _create_table(conn, table_name: str, table_def: dict[str, Any]) -> None:
+def _table_sql(table_name: str, table_def: dict[str, Any]) -> str:
     fields = table_def.get("fields")
     if not isinstance(fields, dict):
         raise SchemaError(f"Table {table_name} fields must be a mapping.")
@@ -77,29 +131,32 @@ def _create_table(conn, table_name: str, table_def: dict[str, Any]) -> None:
         columns.append(f"PRIMARY KEY ({', '.join(primary_key)})")
 
     columns.extend(foreign_keys)
-    ddl = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)});"
-    conn.execute(ddl)
+    return f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)});"
 
 
 def _column_sql(field_name: str, spec: dict[str, Any], primary_key: str | list[str]) -> str:
     field_type = spec.get("type")
     if field_type not in TYPE_MAP:
         raise SchemaError(f"Unknown field type {field_type} for {field_name}.")
-    sql_type = TYPE_MAP[field_type]
-    required = spec.get("required", False)
-    parts = [field_name, sql_type]
-    if required:
-        parts.append("NOT NULL")
-    if isinstance(primary_key, str) and field_name == primary_key:
-        parts.append("PRIMARY KEY")
-    return " ".join(parts)
+    not_null = " NOT NULL" if spec.get("required", False) else ""
+    pk = " PRIMARY KEY" if isinstance(primary_key, str) and field_name == primary_key else ""
+    return f"{field_name} {TYPE_MAP[field_type]}{not_null}{pk}"
 
 
-def _create_indexes(conn, table_name: str, table_def: dict[str, Any]) -> None:
+def _index_sql(table_name: str, table_def: dict[str, Any]) -> Iterator[str]:
     indexes = table_def.get("indexes") or []
-    for index_fields in indexes:
+    for index_def in indexes:
+        where = None
+        if isinstance(index_def, dict):
+            index_fields = index_def.get("fields")
+            where = index_def.get("where")
+        else:
+            index_fields = index_def
         if not isinstance(index_fields, list) or not index_fields:
             continue
         idx_name = f"idx_{table_name}_{'_'.join(index_fields)}"
         cols = ", ".join(index_fields)
-        conn.execute(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} ({cols});")
+        ddl = f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} ({cols})"
+        if where:
+            ddl += f" WHERE {where}"
+        yield f"{ddl};"
@@ -1,13 +1,60 @@
 from __future__ import annotations
 
+import atexit
+import queue
 import sqlite3
-from collections.abc import Iterable
+import threading
+from collections.abc import Iterable, Sequence
 from contextlib import contextmanager
+from itertools import batched, chain
 from pathlib import Path
 from typing import Any
 
 from crm.store.migrations import apply_schema
 
+_MIRROR_STATE_INSERT = (
+    "INSERT INTO mirror_state (table_name, external_id, record_id, mirror_version, mirror_updated_at) "
+    "VALUES "
+)
+_MIRROR_STATE_CONFLICT = (
+    " ON CONFLICT(table_name, external_id) DO UPDATE SET "
+    "record_id=excluded.record_id, mirror_version=excluded.mirror_version, "
+    "mirror_updated_at=excluded.mirror_updated_at"
+)
+UPSERT_MIRROR_STATE_SQL = f"{_MIRROR_STATE_INSERT}(?, ?, ?, ?, ?){_MIRROR_STATE_CONFLICT}"
+
+# Rows per multi-row INSERT; keeps statements under SQLite's historical 999-parameter cap
+# for tables up to 9 columns wide.
+VALUES_BATCH_ROWS = 100
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -20000;",
+    "PRAGMA busy_timeout = 5000;",
+)
+
+READ_PRAGMAS = (
+    "PRAGMA query_only = ON;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -20000;",
+    "PRAGMA busy_timeout = 5000;",
+)
+
+READ_POOL_SIZE = 4
+# Prepared statements kept per connection; long-lived connections reuse them across calls.
+STATEMENT_CACHE_SIZE = 256
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class StoreError(RuntimeError):
+    pass
+
 
 class SqliteSession:
     def __init__(self, conn: sqlite3.Connection) -> None:
@@ -16,6 +63,9 @@ class SqliteSession:
     def execute(self, query: str, params: Iterable[Any] | None = None) -> None:
         self._conn.execute(query, params or [])
 
+    def executemany(self, query: str, rows: Iterable[Iterable[Any]]) -> None:
+        self._conn.executemany(query, rows)
+
     def fetch_all(self, query: str, params: Iterable[Any] | None = None) -> list[sqlite3.Row]:
         cur = self._conn.execute(query, params or [])
         return cur.fetchall()
@@ -24,6 +74,15 @@ class SqliteSession:
         cur = self._conn.execute(query, params or [])
         return cur.fetchone()
 
+    def fetch_all_tuples(
+        self, query: str, params: Iterable[Any] | None = None
+    ) -> list[tuple[Any, ...]]:
+        # Plain tuples in SELECT order, skipping sqlite3.Row construction for bulk reads.
+        cur = self._conn.cursor()
+        cur.row_factory = None
+        cur.execute(query, params or [])
+        return cur.fetchall()
+
     def upsert_mirror_state(
         self,
         table_name: str,
@@ -32,14 +91,24 @@ class SqliteSession:
         mirror_version: int,
         mirror_updated_at: str,
     ) -> None:
-        query = (
-            "INSERT INTO mirror_state (table_name, external_id, record_id, mirror_version, mirror_updated_at) "
-            "VALUES (?, ?, ?, ?, ?) "
-            "ON CONFLICT(table_name, external_id) DO UPDATE SET "
-            "record_id=excluded.record_id, mirror_version=excluded.mirror_version, "
-            "mirror_updated_at=excluded.mirror_updated_at"
+        self.execute(
+            UPSERT_MIRROR_STATE_SQL,
+            (table_name, external_id, record_id, mirror_version, mirror_updated_at),
         )
-        self.execute(query, (table_name, external_id, record_id, mirror_version, mirror_updated_at))
+
+    def insert_values(self, insert: str, rows: Iterable[Sequence[Any]], suffix: str = "") -> None:
+        # One multi-row VALUES statement per batch; full batches share one cached statement.
+        row_marks = ""
+        for batch in batched(rows, VALUES_BATCH_ROWS):
+            if not row_marks:
+                row_marks = "(" + ", ".join("?" * len(batch[0])) + ")"
+            query = f"{insert}{', '.join([row_marks] * len(batch))}{suffix}"
+            self._conn.execute(query, list(chain.from_iterable(batch)))
+
+    def upsert_mirror_state_many(
+        self, rows: Iterable[tuple[str, str, str | None, int, str | None]]
+    ) -> None:
+        self.insert_values(_MIRROR_STATE_INSERT, rows, _MIRROR_STATE_CONFLICT)
 
     def get_mirror_state(self, table_name: str, external_id: str) -> sqlite3.Row | None:
         return self.fetch_one(
@@ -49,46 +118,202 @@ class SqliteSession:
 
 
 class SqliteStore:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, read_pool_size: int = READ_POOL_SIZE) -> None:
         self.db_path = Path(db_path)
+        # Created once here rather than on every connection open.
+        if not self.db_path.parent.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(read_pool_size)
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+        # Per thread: the connection an open transaction() runs on, or None.
+        self._local = threading.local()
 
     @contextmanager
-    def connect(self):
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+    def connect(self, immediate: bool = False):
+        conn = self._transaction_conn()
+        if conn is not None:
+            # Inside transaction(): join it and leave commit or rollback to the outer scope.
+            yield conn
+            return
+        with self._writer_connection() as conn, self._transaction(conn, immediate):
+            yield conn
+
+    def _transaction_conn(self) -> sqlite3.Connection | None:
+        return getattr(self._local, "conn", None)
+
+    def _require_no_transaction(self, operation: str) -> None:
+        if self._transaction_conn() is not None:
+            raise StoreError(f"{operation} cannot run inside store.transaction().")
+
+    @contextmanager
+    def _writer_connection(self):
+        # The long-lived writer serves one caller at a time; a nested or concurrent
+        # caller gets a short-lived connection, as every caller did before.
+        if not self._writer_lock.acquire(blocking=False):
+            conn = self._open_writer()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+        try:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            yield self._writer
+        finally:
+            self._writer_lock.release()
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection, immediate: bool):
+        # Writers run with isolation_level=None, so every block opens its transaction here.
+        # IMMEDIATE takes the write lock up front instead of failing to upgrade a read lock
+        # mid-transaction.
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _open_writer(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def read(self):
+        # Read-only connections are pooled; under WAL they never wait on the writer.
+        conn = self._transaction_conn()
+        if conn is not None:
+            # Inside transaction(), read on its connection to see its uncommitted changes.
+            yield conn
+            return
+        if not self.db_path.exists():
+            # mode=ro cannot create the file; the writer creates it, as plain connects did.
+            with self._writer_connection() as conn:
+                yield conn
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def close(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                return
 
     @contextmanager
-    def session(self) -> SqliteSession:
-        with self.connect() as conn:
+    def transaction(self):
+        # Groups several service calls into one BEGIN IMMEDIATE ... COMMIT. A nested
+        # transaction() joins the outer one, which keeps commit or rollback.
+        conn = self._transaction_conn()
+        if conn is not None:
+            yield SqliteSession(conn)
+            return
+        with self.connect(immediate=True) as conn:
+            self._local.conn = conn
+            try:
+                yield SqliteSession(conn)
+            finally:
+                self._local.conn = None
+
+    @contextmanager
+    def bulk_load(self):
+        # Drops the schema's secondary indexes, loads, and rebuilds each index once at the end.
+        # All of it is one transaction, so a failed load rolls back with the indexes intact.
+        with self.transaction() as session:
+            indexes = session.fetch_all_tuples(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type = 'index' AND name LIKE 'idx\\_%' ESCAPE '\\' AND sql IS NOT NULL"
+            )
+            for name, _ in indexes:
+                session.execute(f"DROP INDEX {quote_identifier(name)}")
+            yield session
+            for _, sql in indexes:
+                session.execute(sql)
+
+    @contextmanager
+    def session(self, immediate: bool = False) -> SqliteSession:
+        with self.connect(immediate=immediate) as conn:
             yield SqliteSession(conn)
 
     def apply_schema(self, schema_path: Path) -> None:
-        with self.connect() as conn:
+        # The schema script carries its own BEGIN ... COMMIT.
+        self._require_no_transaction("apply_schema")
+        with self._writer_connection() as conn:
             apply_schema(conn, schema_path)
 
+    def backup_to(self, dest_path: Path) -> None:
+        # VACUUM INTO writes a consistent, compacted copy even while other connections write;
+        # it cannot run inside a transaction.
+        self._require_no_transaction("backup_to")
+        dest_path.unlink(missing_ok=True)
+        with self._writer_connection() as conn:
+            conn.execute("VACUUM INTO ?", (str(dest_path),))
+
     def execute(self, query: str, params: Iterable[Any] | None = None) -> None:
         with self.connect() as conn:
             conn.execute(query, params or [])
 
     def fetch_all(self, query: str, params: Iterable[Any] | None = None) -> list[sqlite3.Row]:
-        with self.connect() as conn:
+        with self.read() as conn:
             cur = conn.execute(query, params or [])
             return cur.fetchall()
 
+    @contextmanager
+    def iter_rows(self, query: str, params: Iterable[Any] | None = None):
+        # Yields a live cursor of plain tuples; column names come from its description.
+        with self.read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(query, params or [])
+            try:
+                yield cur
+            finally:
+                cur.close()
+
     def fetch_one(self, query: str, params: Iterable[Any] | None = None) -> sqlite3.Row | None:
-        with self.connect() as conn:
+        with self.read() as conn:
             cur = conn.execute(query, params or [])
-            return cur.fetchone()
+            row = cur.fetchone()
+            # Reset the statement so the pooled connection does not pin a WAL snapshot.
+            cur.close()
+            return row
 
     def upsert_mirror_state(
         self,
@@ -106,3 +331,24 @@ class SqliteStore:
     def get_mirror_state(self, table_name: str, external_id: str) -> sqlite3.Row | None:
         with self.session() as session:
             return session.get_mirror_state(table_name, external_id)
+
+
+# One store per database path, so its read pool is reused across commands in the same process.
+_stores: dict[Path, SqliteStore] = {}
+
+
+def get_store(db_path: Path) -> SqliteStore:
+    key = Path(db_path).absolute()
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = SqliteStore(key)
+    return store
+
+
+@atexit.register
+def close_stores() -> None:
+    # Closes every cached store's connections; runs at interpreter exit, and the next
+    # get_store opens a fresh one.
+    while _stores:
+        _, store = _stores.popitem()
+        store.close()
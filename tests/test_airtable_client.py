@@ -0,0 +1,197 @@
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from crm import cli
+from crm.adapters.airtable import client as client_module
+from crm.adapters.airtable.client import AirtableClient
+from crm.config import set_current_workspace, update_workspace_table_ids, write_workspace_config
+
+
+class RecordingClient(AirtableClient):
+    def __init__(self) -> None:
+        super().__init__(api_key="patTest", base_id="appTest")
+        self.requests = []
+        self.formulas = []
+
+    def _request(self, method, path, params=None, json=None):
+        self.requests.append((method, path))
+        if params and params.get("filterByFormula"):
+            self.formulas.append(params["filterByFormula"])
+            if "'w1'" not in params["filterByFormula"]:
+                return {"records": []}
+            return {"records": [{"id": "rec1", "fields": {"ExternalId": "w1"}}]}
+        if path.endswith("/tables") and method == "GET":
+            return {"tables": [{"id": "tblWidgets", "name": "Widgets", "fields": []}]}
+        if path.endswith("/tblWidgets") and method == "GET":
+            if params.get("offset") == "page2":
+                return {"records": [{"id": "rec2", "fields": {"ExternalId": "w2"}}]}
+            return {
+                "records": [{"id": "rec1", "fields": {"ExternalId": "w1"}}],
+                "offset": "page2",
+            }
+        return {"id": "fldNew"}
+
+
+def test_list_tables_is_cached_until_schema_changes() -> None:
+    client = RecordingClient()
+
+    client.list_tables()
+    client.list_tables()
+    assert [method for method, _ in client.requests] == ["GET"]
+
+    client.create_field("tblWidgets", "Name", "singleLineText")
+    client.list_tables()
+    assert [method for method, _ in client.requests] == ["GET", "POST", "GET"]
+
+
+def test_table_indexes_are_memoized_with_the_tables_cache() -> None:
+    client = RecordingClient()
+
+    index = client.fields_by_table()
+    assert index == {"tblWidgets": {}}
+    assert client.fields_by_table() is index
+    assert len(client.requests) == 1
+
+    by_id, by_name = client.tables_index()
+    assert by_id["tblWidgets"] is by_name["Widgets"]
+    assert client.tables_index()[0] is by_id
+    assert len(client.requests) == 1
+
+    client.invalidate_tables_cache()
+    assert client.fields_by_table() is not index
+    assert client.tables_index()[0] is not by_id
+
+
+def test_iter_records_streams_pages_lazily() -> None:
+    client = RecordingClient()
+
+    records = client.iter_records("tblWidgets", fields=["ExternalId"])
+    assert client.requests == []
+    assert next(records).record_id == "rec1"
+    assert len(client.requests) == 1
+    assert [record.record_id for record in records] == ["rec2"]
+    assert len(client.requests) == 2
+
+
+def test_find_records_by_external_ids_batches_or_formulas() -> None:
+    client = RecordingClient()
+
+    found = client.find_records_by_external_ids("tblWidgets", [f"w{i}" for i in range(60)])
+
+    assert list(found) == ["w1"]
+    assert len(client.formulas) == 2
+    assert client.formulas[0].startswith("OR({ExternalId}='w0',{ExternalId}='w1',")
+
+
+class CountingClient(AirtableClient):
+    def __init__(self) -> None:
+        super().__init__(api_key="patTest", base_id="appTest", response_cache_ttl=60.0)
+        self.sent = []
+
+    def _send(self, method, path, params=None, json=None):
+        self.sent.append(method)
+        if method == "PATCH":
+            return {"id": "rec1", "fields": json["fields"]}
+        return {"records": [{"id": "rec1", "fields": {"ExternalId": "w1"}}]}
+
+
+def test_response_cache_reuses_gets_until_a_write() -> None:
+    client = CountingClient()
+
+    client.list_records("tblWidgets", fields=["ExternalId"])
+    client.list_records("tblWidgets", fields=["ExternalId"])
+    client.list_records("tblWidgets", fields=["Name"])
+    assert client.sent == ["GET", "GET"]
+
+    client.update_record("tblWidgets", "rec1", {"Name": "New"})
+    client.list_records("tblWidgets", fields=["ExternalId"])
+    assert client.sent == ["GET", "GET", "PATCH", "GET"]
+
+
+def test_requests_are_paced_to_the_base_rate_limit(monkeypatch) -> None:
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    client = AirtableClient(api_key="patTest", base_id="appTest", max_requests_per_second=5)
+
+    for _ in range(3):
+        client._pace()
+    clock[0] = 101.0
+    client._pace()
+
+    assert sleeps == pytest.approx([0.2, 0.4])
+
+
+class ConditionalClient(AirtableClient):
+    def __init__(self, cache_dir) -> None:
+        super().__init__(api_key="patTest", base_id="appTest", metadata_cache_dir=cache_dir)
+        self.sent_headers = []
+
+    def _send_response(self, method, path, params=None, json=None, headers=None):
+        self.sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return SimpleNamespace(status_code=304, headers={})
+        tables = [{"id": "tblWidgets", "name": "Widgets", "fields": []}]
+        return SimpleNamespace(
+            status_code=200, headers={"ETag": '"v1"'}, json=lambda: {"tables": tables}
+        )
+
+
+def test_list_tables_revalidates_with_a_persisted_etag(tmp_path) -> None:
+    first = ConditionalClient(tmp_path)
+    tables = first.list_tables()
+    assert (tmp_path / "airtable_meta_appTest.json").exists()
+
+    second = ConditionalClient(tmp_path)
+    assert second.list_tables() == tables
+    assert first.sent_headers == [None]
+    assert second.sent_headers == [{"If-None-Match": '"v1"'}]
+
+
+def test_response_cache_serves_repeated_external_id_lookups() -> None:
+    client = CountingClient()
+
+    first = client.find_record_by_external_id("tblWidgets", "w1")
+    second = client.find_record_by_external_id("tblWidgets", "w1")
+
+    assert first == second
+    assert client.sent == ["GET"]
+
+
+def test_open_airtable_serves_repeated_lookups_from_the_response_cache(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = write_workspace_config("demo", base_id="appDemo")
+    update_workspace_table_ids(config_path, {"organizations": "tblOrgs"})
+    set_current_workspace("demo")
+    monkeypatch.setenv("AIRTABLE_API_KEY", "patTest")
+    sent = []
+
+    def send(self, method, path, params=None, json=None):
+        sent.append((method, path))
+        return {"records": []}
+
+    monkeypatch.setattr(AirtableClient, "_send", send)
+    cli._lookup_client.cache_clear()
+    runner = CliRunner()
+    assert runner.invoke(cli.app, ["schema", "apply"]).exit_code == 0
+    try:
+        first = runner.invoke(cli.app, ["open", "airtable", "missing"])
+        second = runner.invoke(cli.app, ["open", "airtable", "missing"])
+    finally:
+        cli._lookup_client.cache_clear()
+
+    assert first.exit_code == second.exit_code == 1
+    assert "Record not found" in second.output
+    assert sent == [("GET", "/v0/appDemo/tblOrgs")]
+
+
+def test_error_type_is_read_from_airtable_error_bodies() -> None:
+    body = {"error": {"type": "UNKNOWN_FIELD_NAME", "message": "Unknown field name"}}
+
+    assert client_module._error_type(SimpleNamespace(json=lambda: body)) == "UNKNOWN_FIELD_NAME"
+    assert client_module._error_type(SimpleNamespace(json=lambda: {"error": "NOT_FOUND"})) is None
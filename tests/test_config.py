@@ -1,6 +1,14 @@
 from pathlib import Path
 
-from crm.config import WORKSPACES_DIR, _resolve_sqlite_path
+from crm.config import (
+    MAPPING_PATH,
+    SCHEMA_PATH,
+    WORKSPACES_DIR,
+    _resolve_sqlite_path,
+    load_workspace,
+    update_workspace_table_ids,
+    write_workspace_config,
+)
 
 
 def test_resolve_sqlite_path_relative(tmp_path: Path) -> None:
@@ -21,3 +29,44 @@ def test_resolve_sqlite_path_repo_relative(tmp_path: Path) -> None:
 
     resolved = _resolve_sqlite_path("workspaces/demo/local.sqlite", config_path)
     assert resolved == (tmp_path / "workspaces" / "demo" / "local.sqlite").resolve()
+
+
+def test_resolve_sqlite_path_normalizes_without_touching_disk(tmp_path: Path) -> None:
+    config_path = tmp_path / WORKSPACES_DIR / "demo" / "workspace.yaml"
+
+    resolved = _resolve_sqlite_path("../shared/./local.sqlite", config_path)
+    assert resolved == tmp_path / WORKSPACES_DIR / "shared" / "local.sqlite"
+
+
+def test_load_workspace_reuses_parse_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = write_workspace_config("demo", base_id="appOld")
+
+    first = load_workspace("demo")
+    assert load_workspace("demo") is first
+
+    update_workspace_table_ids(config_path, {"organizations": "tblOrgs"})
+    reloaded = load_workspace("demo")
+    assert reloaded is not first
+    assert reloaded.mirror.tables["organizations"] == "tblOrgs"
+
+
+def test_update_workspace_table_ids_backs_up_only_on_change(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = write_workspace_config("demo", base_id="appDemo")
+    original = config_path.read_text(encoding="utf-8")
+
+    backup_path = update_workspace_table_ids(config_path, {"organizations": "tblOrgs"})
+
+    assert backup_path.read_text(encoding="utf-8") == original
+    assert "tblOrgs" in config_path.read_text(encoding="utf-8")
+    assert update_workspace_table_ids(config_path, {"organizations": "tblOrgs"}) is None
+    assert list(config_path.parent.glob("*.bak.*")) == [backup_path]
+
+
+def test_resource_paths_do_not_depend_on_the_working_directory(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    assert SCHEMA_PATH.is_absolute()
+    assert SCHEMA_PATH.is_file()
+    assert MAPPING_PATH.is_file()
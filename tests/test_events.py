@@ -0,0 +1,19 @@
+import json
+from pathlib import Path
+
+from crm.services import events
+from crm.services.events import EventLogger
+
+
+def test_event_logger_buffers_until_flush(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(events, "FLUSH_EVERY", 3)
+    path = tmp_path / "logs" / "events.ndjson"
+
+    with EventLogger(path=path, workspace="demo") as logger:
+        for index in range(4):
+            logger.log(event_type="push", entity_type="widgets", external_id=f"w{index}")
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["external_id"] for line in lines] == ["w0", "w1", "w2", "w3"]
+    assert lines[0]["workspace"] == "demo"
@@ -0,0 +1,53 @@
+import csv
+from datetime import date
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from crm.services import exports, leads
+from crm.store.sqlite import SqliteStore
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
+
+def _store(tmp_path: Path) -> SqliteStore:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(SCHEMA_PATH)
+    leads.add_sponsor_lead(
+        store,
+        org_name="Acme Bio",
+        domain="acmebio.com",
+        contact="Jane Doe <jane@acmebio.com>",
+        stage="contacted",
+        value=15000,
+        tier="gold",
+        next_action="Send deck",
+        due=date(2026, 1, 20),
+        notes=None,
+    )
+    return store
+
+
+def test_export_csv_tables_streams_rows_with_headers(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    exports.export_csv_tables(store, tmp_path / "csv")
+
+    with (tmp_path / "csv" / "organizations.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["name"] for row in rows] == ["Acme Bio"]
+    with (tmp_path / "csv" / "tasks.csv").open(newline="", encoding="utf-8") as handle:
+        assert "task_id" in next(csv.reader(handle))
+
+
+def test_export_excel_writes_one_sheet_per_table(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    out_path = tmp_path / "export.xlsx"
+
+    exports.export_excel(store, out_path)
+
+    wb = load_workbook(out_path, read_only=True)
+    assert wb.sheetnames == exports.TABLES
+    values = list(wb["sponsor_opps"].values)
+    assert values[0][0] == "opp_id"
+    assert values[1][values[0].index("next_action")] == "Send deck"
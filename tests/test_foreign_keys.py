@@ -5,11 +5,12 @@ import pytest
 
 from crm.store.sqlite import SqliteStore
 
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
 
 def test_foreign_keys_enforced(tmp_path: Path) -> None:
     store = SqliteStore(tmp_path / "test.sqlite")
-    schema_path = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
-    store.apply_schema(schema_path)
+    store.apply_schema(SCHEMA_PATH)
 
     with pytest.raises(sqlite3.IntegrityError):
         store.execute(
@@ -1,15 +1,21 @@
 from datetime import date
 from pathlib import Path
 
+import pytest
+
+from crm.domain.rules import ValidationError
+from crm.domain.stages import SPONSOR_STAGE_VALUES
 from crm.services import leads
+from crm.services.utils import parse_contact
 from crm.store.sqlite import SqliteStore
 
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
 
 def _store(tmp_path: Path) -> SqliteStore:
     db_path = tmp_path / "test.sqlite"
     store = SqliteStore(db_path)
-    schema_path = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
-    store.apply_schema(schema_path)
+    store.apply_schema(SCHEMA_PATH)
     return store
 
 
@@ -29,11 +35,15 @@ def test_add_sponsor_lead(tmp_path: Path) -> None:
     )
     row = store.fetch_one("SELECT opp_id FROM sponsor_opps WHERE opp_id = ?", (opp_id,))
     assert row is not None
+    assert leads.list_sponsor_leads(store, "contacted") == [
+        leads.SponsorLeadRow(opp_id, "Acme Bio", "contacted", "Send deck", "2026-01-20")
+    ]
+    assert leads.list_sponsor_leads(store, "won") == []
 
 
 def test_next_actions(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    leads.add_sponsor_lead(
+    opp_id = leads.add_sponsor_lead(
         store,
         org_name="Acme Bio",
         domain=None,
@@ -46,4 +56,82 @@ def test_next_actions(tmp_path: Path) -> None:
         notes=None,
     )
     actions = leads.next_actions(store, limit=5)
-    assert actions
+    assert actions == [leads.LeadNextItem("sponsor", opp_id, "Acme Bio", "Send deck", "2026-01-20")]
+
+
+def test_add_sponsor_lead_reuses_org_and_person(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    for org_name in ("Acme Bio", "Acme Biosciences"):
+        leads.add_sponsor_lead(
+            store,
+            org_name=org_name,
+            domain="acmebio.com",
+            contact="Jane Doe <jane@acmebio.com>",
+            stage="contacted",
+            value=None,
+            tier=None,
+            next_action=None,
+            due=None,
+            notes=None,
+        )
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM organizations")["n"] == 1
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM people")["n"] == 1
+
+
+def test_add_sponsor_leads_bulk_shares_orgs_and_people(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    existing = leads.add_sponsor_lead(
+        store,
+        org_name="Acme Bio",
+        domain="acmebio.com",
+        contact=None,
+        stage="targeted",
+        value=None,
+        tier=None,
+        next_action=None,
+        due=None,
+        notes=None,
+    )
+
+    opp_ids = leads.add_sponsor_leads_bulk(
+        store,
+        [
+            leads.SponsorLeadInput("Acme Biosciences", "contacted", domain="acmebio.com"),
+            leads.SponsorLeadInput("Beta Labs", "targeted", contact="Sam Lee <sam@beta.io>"),
+            leads.SponsorLeadInput("Beta Labs", "engaged", contact="Sam Lee", tier="gold"),
+        ],
+    )
+
+    assert len(set(opp_ids)) == 3
+    rows = store.fetch_all("SELECT org_id, primary_person_id FROM sponsor_opps")
+    org_by_opp = {row["org_id"] for row in rows}
+    assert len(org_by_opp) == 2
+    acme = store.fetch_one("SELECT org_id FROM sponsor_opps WHERE opp_id = ?", (existing,))
+    assert acme["org_id"] in org_by_opp
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM people")["n"] == 1
+
+
+def test_parse_contact_formats() -> None:
+    assert parse_contact("Jane Doe <jane@acmebio.com>") == ("Jane Doe", "jane@acmebio.com")
+    assert parse_contact("  Jane Doe ") == ("Jane Doe", None)
+    assert parse_contact("<jane@acmebio.com>") == ("<jane@acmebio.com>", None)
+    assert parse_contact("Jane <jane@acmebio.com> x") == ("Jane <jane@acmebio.com> x", None)
+
+
+def test_add_sponsor_lead_rejects_unknown_stage(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    with pytest.raises(ValidationError, match="stage must be one of: "):
+        leads.add_sponsor_lead(
+            store,
+            org_name="Acme Bio",
+            domain=None,
+            contact=None,
+            stage="archived",
+            value=None,
+            tier=None,
+            next_action=None,
+            due=None,
+            notes=None,
+        )
+    assert isinstance(SPONSOR_STAGE_VALUES, frozenset)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from crm.adapters.airtable.mirror import load_mapping
@@ -9,3 +10,14 @@ def test_load_mapping_has_tables() -> None:
     )
     assert "organizations" in mapping.tables
     assert "ExternalId" in mapping.mirror_fields
+
+
+def test_load_mapping_reloads_when_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "mapping.yaml"
+    path.write_text("tables:\n  widgets: {}\n", encoding="utf-8")
+    first = load_mapping(path)
+    assert load_mapping(path) is first
+
+    path.write_text("tables:\n  gadgets: {}\n", encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert list(load_mapping(path).tables) == ["gadgets"]
@@ -1,9 +1,21 @@
-from crm.adapters.airtable.mirror import AirtableMapping, diff_schema
+from dataclasses import asdict
+
+import pytest
+
+from crm.adapters.airtable.client import AirtableClient
+from crm.adapters.airtable.mirror import (
+    AirtableMapping,
+    MirrorError,
+    diff_schema,
+    expected_tables,
+    validate_schema,
+)
+from crm.adapters.airtable.schema import bootstrap, configure_modified_time_fields, doctor
 from crm.store.migrations import Schema
 
 
-def test_modified_time_misconfigured() -> None:
-    mapping = AirtableMapping(
+def _mapping() -> AirtableMapping:
+    return AirtableMapping(
         mirror_fields={
             "ExternalId": {"type": "text"},
             "MirrorVersion": {"type": "number"},
@@ -21,7 +33,10 @@ def test_modified_time_misconfigured() -> None:
             }
         },
     )
-    schema = Schema(
+
+
+def _schema() -> Schema:
+    return Schema(
         version=1,
         enums={},
         tables={
@@ -36,7 +51,10 @@ def test_modified_time_misconfigured() -> None:
             }
         },
     )
-    tables_meta = [
+
+
+def _tables_meta() -> list[dict]:
+    return [
         {
             "id": "tblWidgets",
             "name": "Widgets",
@@ -56,5 +74,91 @@ def test_modified_time_misconfigured() -> None:
         }
     ]
 
-    diff = diff_schema(tables_meta, mapping, schema, {"widgets": "tblWidgets"}, True)
+
+def test_modified_time_misconfigured() -> None:
+    diff = diff_schema(_tables_meta(), _mapping(), _schema(), {"widgets": "tblWidgets"}, True)
     assert diff.misconfigured_modified_time["widgets"] == ["Notes"]
+
+
+class MetaClient(AirtableClient):
+    def __init__(self, tables=None) -> None:
+        super().__init__(api_key="patTest", base_id="appTest")
+        self.requests = []
+        self.tables = _tables_meta() if tables is None else tables
+
+    def _request(self, method, path, params=None, json=None):
+        self.requests.append(method)
+        return {"tables": self.tables}
+
+
+def test_bootstrap_dry_run_fetches_base_metadata_once() -> None:
+    client = MetaClient()
+    table_ids = {"widgets": "tblWidgets"}
+
+    result = bootstrap(client, _mapping(), _schema(), table_ids, apply=False)
+    actions = configure_modified_time_fields(client, _mapping(), _schema(), table_ids, apply=False)
+
+    assert result.missing_modified_time == []
+    assert actions
+    assert client.requests == ["GET"]
+
+
+def test_expected_tables_are_reused_for_the_same_mapping_and_schema() -> None:
+    mapping, schema = _mapping(), _schema()
+
+    first = expected_tables(mapping, schema, include_modified_time=True)
+    assert expected_tables(mapping, schema, include_modified_time=True) is first
+    assert expected_tables(mapping, schema, include_modified_time=False) is not first
+    assert expected_tables(_mapping(), schema, include_modified_time=True) == first
+
+
+def test_fail_fast_diff_stops_after_first_table_with_errors() -> None:
+    base = _mapping()
+    mapping = AirtableMapping(
+        mirror_fields=base.mirror_fields,
+        tables={"gadgets": base.tables["widgets"], "widgets": base.tables["widgets"]},
+    )
+    schema = _schema()
+    schema = Schema(
+        version=1,
+        enums={},
+        tables={"gadgets": schema.tables["widgets"], "widgets": schema.tables["widgets"]},
+    )
+    table_ids = {"gadgets": "tblMissing", "widgets": "tblGone"}
+
+    full = diff_schema(_tables_meta(), mapping, schema, table_ids, True)
+    partial = diff_schema(_tables_meta(), mapping, schema, table_ids, True, fail_fast=True)
+
+    assert full.missing_tables == ["gadgets", "widgets"]
+    assert partial.missing_tables == ["gadgets"]
+    assert partial.has_errors
+
+
+def test_doctor_reports_the_same_messages_as_push_validation() -> None:
+    client = MetaClient()
+    result = doctor(client, _mapping(), _schema(), {"widgets": "tblWidgets"})
+
+    assert result.exit_code == 1
+    assert result.messages == [
+        "widgets missing fields: MirrorVersion, MirrorUpdatedAt",
+        "widgets AirtableModifiedAt missing watched fields: Notes",
+    ]
+    with pytest.raises(MirrorError, match="; ".join(result.messages)):
+        validate_schema(client, _mapping(), _schema(), {"widgets": "tblWidgets"})
+    diff = result.diff.to_dict()
+    assert diff == asdict(result.diff)
+    assert diff["missing_fields"] is result.diff.missing_fields
+
+
+def test_bootstrap_dry_run_reports_missing_modified_time_without_a_second_diff(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tables = _tables_meta()
+    tables[0]["fields"] = tables[0]["fields"][:-1]
+    monkeypatch.setattr(
+        "crm.adapters.airtable.schema.diff_schema", lambda *args, **kwargs: pytest.fail("diffed")
+    )
+
+    result = bootstrap(MetaClient(tables), _mapping(), _schema(), {"widgets": "tblWidgets"})
+
+    assert result.missing_modified_time == ["widgets"]
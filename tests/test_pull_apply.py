@@ -0,0 +1,263 @@
+import sqlite3
+from pathlib import Path
+
+import yaml
+
+from crm.adapters.airtable.client import AirtableRecord
+from crm.adapters.airtable.mirror import AirtableMapping
+from crm.adapters.airtable.pull import pull_records
+from crm.store.migrations import load_schema
+from crm.store.sqlite import SqliteStore
+
+
+class FakeClient:
+    def __init__(self, records) -> None:
+        self.records = records
+
+    def iter_record_pages(self, table_id, fields=None, filter_formula=None):
+        yield self.records
+
+
+def _schema_path(tmp_path: Path) -> Path:
+    schema = {
+        "version": 1,
+        "enums": {},
+        "tables": {
+            "widgets": {
+                "primary_key": "widget_id",
+                "fields": {
+                    "widget_id": {"type": "uuid", "required": True},
+                    "name": {"type": "text"},
+                    "size": {"type": "number"},
+                    "created_at": {"type": "datetime", "required": True},
+                    "updated_at": {"type": "datetime", "required": True},
+                },
+            },
+            "mirror_state": {
+                "primary_key": ["table_name", "external_id"],
+                "fields": {
+                    "table_name": {"type": "text", "required": True},
+                    "external_id": {"type": "text", "required": True},
+                    "record_id": {"type": "text"},
+                    "mirror_version": {"type": "number"},
+                    "mirror_updated_at": {"type": "datetime"},
+                },
+            },
+        },
+    }
+    path = tmp_path / "schema.yaml"
+    path.write_text(yaml.safe_dump(schema, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def _mapping() -> AirtableMapping:
+    return AirtableMapping(
+        mirror_fields={
+            "ExternalId": {"type": "text"},
+            "MirrorVersion": {"type": "number"},
+            "MirrorUpdatedAt": {"type": "datetime"},
+        },
+        tables={
+            "widgets": {
+                "fields": {
+                    "widget_id": "ExternalId",
+                    "name": "Name",
+                    "size": "Size",
+                    "created_at": "Created At",
+                    "updated_at": "Updated At",
+                }
+            }
+        },
+    )
+
+
+def test_pull_apply_creates_updates_and_skips(tmp_path: Path) -> None:
+    schema_path = _schema_path(tmp_path)
+    schema = load_schema(schema_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    for widget_id, name in (("w1", "Old"), ("w2", "Same")):
+        store.execute(
+            "INSERT INTO widgets (widget_id, name, size, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (widget_id, name, 1.0, "2026-01-01T00:00:00+00:00", "2026-01-01T00:00:00+00:00"),
+        )
+        store.upsert_mirror_state(
+            "widgets", widget_id, f"rec{widget_id}", 1, "2026-01-02T00:00:00+00:00"
+        )
+    client = FakeClient(
+        [
+            AirtableRecord(
+                "recw1", {"ExternalId": "w1", "Name": "New", "Size": 1, "MirrorVersion": 2}
+            ),
+            AirtableRecord("recw2", {"ExternalId": "w2", "Name": "Same", "Size": 1}),
+            AirtableRecord(
+                "recw3",
+                {
+                    "ExternalId": "w3",
+                    "Name": "Fresh",
+                    "Size": 3,
+                    "Created At": "2026-01-03T00:00:00+00:00",
+                    "Updated At": "2026-01-03T00:00:00+00:00",
+                },
+            ),
+            AirtableRecord("recNone", {"Name": "No id"}),
+        ]
+    )
+
+    summary, changes = pull_records(
+        store,
+        client,
+        _mapping(),
+        schema,
+        {"widgets": "tblWidgets"},
+        None,
+        last_pull_at=None,
+        apply=True,
+    )
+
+    assert (summary.scanned, summary.applied, summary.created, summary.skipped) == (4, 1, 1, 1)
+    assert summary.ignored == 1
+    assert [(change.external_id, change.action) for change in changes] == [
+        ("w1", "apply"),
+        ("w3", "create"),
+    ]
+    assert store.fetch_one("SELECT name FROM widgets WHERE widget_id = 'w1'")["name"] == "New"
+    assert store.fetch_one("SELECT size FROM widgets WHERE widget_id = 'w3'")["size"] == 3.0
+    state = store.get_mirror_state("widgets", "w1")
+    assert state["mirror_version"] == 2
+
+
+def test_pull_apply_handles_repeated_external_ids(tmp_path: Path) -> None:
+    schema_path = _schema_path(tmp_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    stamps = {"Created At": "2026-01-03T00:00:00+00:00", "Updated At": "2026-01-03T00:00:00+00:00"}
+    client = FakeClient(
+        [
+            AirtableRecord("recA", {"ExternalId": "w1", "Name": "First", **stamps}),
+            AirtableRecord("recB", {"ExternalId": "w1", "Name": "Second", **stamps}),
+        ]
+    )
+
+    summary, _ = pull_records(
+        store,
+        client,
+        _mapping(),
+        load_schema(schema_path),
+        {"widgets": "tblWidgets"},
+        None,
+        last_pull_at=None,
+        apply=True,
+    )
+
+    assert (summary.created, summary.applied) == (1, 1)
+    assert store.fetch_one("SELECT name FROM widgets WHERE widget_id = 'w1'")["name"] == "Second"
+    assert store.get_mirror_state("widgets", "w1")["record_id"] == "recB"
+
+
+class LockProbeClient(FakeClient):
+    def __init__(self, records, db_path: Path) -> None:
+        super().__init__(records)
+        self.db_path = db_path
+
+    def iter_record_pages(self, table_id, fields=None, filter_formula=None):
+        yield self.records[:1]
+        # Fetched while the first page is processed; another writer must still get in.
+        conn = sqlite3.connect(self.db_path, timeout=0)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.rollback()
+        conn.close()
+        yield self.records[1:]
+
+
+def test_pull_apply_does_not_hold_the_write_lock_while_paging(tmp_path: Path) -> None:
+    schema_path = _schema_path(tmp_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    stamps = {"Created At": "2026-01-03T00:00:00+00:00", "Updated At": "2026-01-03T00:00:00+00:00"}
+    client = LockProbeClient(
+        [
+            AirtableRecord("recw1", {"ExternalId": "w1", "Name": "One", **stamps}),
+            AirtableRecord("recw2", {"ExternalId": "w2", "Name": "Two", **stamps}),
+        ],
+        tmp_path / "test.sqlite",
+    )
+
+    summary, _ = pull_records(
+        store,
+        client,
+        _mapping(),
+        load_schema(schema_path),
+        {"widgets": "tblWidgets"},
+        None,
+        last_pull_at=None,
+        apply=True,
+    )
+
+    assert summary.created == 2
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 2
+
+
+class ConcurrentEditClient(FakeClient):
+    def __init__(self, records, db_path: Path) -> None:
+        super().__init__(records)
+        self.db_path = db_path
+
+    def iter_record_pages(self, table_id, fields=None, filter_formula=None):
+        yield self.records[:2]
+        # Local writes land after the snapshot and before the pull writes.
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "UPDATE widgets SET name = 'Local', updated_at = '2026-02-01T00:00:00+00:00' "
+            "WHERE widget_id = 'w1'"
+        )
+        conn.execute(
+            "INSERT INTO widgets (widget_id, name, created_at, updated_at) "
+            "VALUES ('w3', 'Local', '2026-02-01T00:00:00+00:00', '2026-02-01T00:00:00+00:00')"
+        )
+        conn.commit()
+        conn.close()
+        yield self.records[2:]
+
+
+def test_pull_apply_keeps_local_writes_made_while_paging(tmp_path: Path) -> None:
+    schema_path = _schema_path(tmp_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    store.execute(
+        "INSERT INTO widgets (widget_id, name, size, created_at, updated_at) "
+        "VALUES ('w1', 'Old', 1.0, '2026-01-01T00:00:00+00:00', '2026-01-01T00:00:00+00:00')"
+    )
+    store.upsert_mirror_state("widgets", "w1", "recw1", 1, "2026-01-02T00:00:00+00:00")
+    stamps = {"Created At": "2026-01-03T00:00:00+00:00", "Updated At": "2026-01-03T00:00:00+00:00"}
+    client = ConcurrentEditClient(
+        [
+            AirtableRecord("recw1", {"ExternalId": "w1", "Name": "Remote", "Size": 1}),
+            AirtableRecord("recw3", {"ExternalId": "w3", "Name": "Remote", **stamps}),
+            AirtableRecord("recw2", {"ExternalId": "w2", "Name": "Two", **stamps}),
+        ],
+        tmp_path / "test.sqlite",
+    )
+
+    summary, changes = pull_records(
+        store,
+        client,
+        _mapping(),
+        load_schema(schema_path),
+        {"widgets": "tblWidgets"},
+        None,
+        last_pull_at=None,
+        apply=True,
+    )
+
+    assert (summary.applied, summary.created, summary.conflicts) == (0, 1, 2)
+    assert [(change.external_id, change.action) for change in changes] == [
+        ("w1", "conflict"),
+        ("w3", "conflict"),
+        ("w2", "create"),
+    ]
+    rows = store.fetch_all("SELECT widget_id, name FROM widgets ORDER BY widget_id")
+    assert [tuple(row) for row in rows] == [("w1", "Local"), ("w2", "Two"), ("w3", "Local")]
+    assert store.get_mirror_state("widgets", "w1")["mirror_version"] == 1
+    assert store.get_mirror_state("widgets", "w3") is None
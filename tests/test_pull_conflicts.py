@@ -1,4 +1,5 @@
-from crm.services.pull import decide_pull_action
+from crm.services import pull
+from crm.services.pull import build_diff_plan, decide_pull_action, diff_planned_fields
 
 
 def test_conflict_when_local_and_remote_changed() -> None:
@@ -35,3 +36,29 @@ def test_skip_when_only_local_changed() -> None:
         remote_modified_at="2026-01-02T00:00:00+00:00",
     )
     assert decision.action == "skip"
+
+
+def test_diff_plan_skips_timestamps_and_normalizes_values() -> None:
+    plan = build_diff_plan(
+        {"name": "Name", "size": "Size", "updated_at": "Updated At"},
+        {"name": {"type": "text"}, "size": {"type": "number"}},
+    )
+    changed = diff_planned_fields(
+        local_row={"name": "Same", "size": 1.0, "updated_at": "old"},
+        remote_fields={"Name": "Same", "Size": 1, "Updated At": "new"},
+        plan=plan,
+    )
+    assert changed == []
+    assert diff_planned_fields(local_row=None, remote_fields={"Name": "New"}, plan=plan) == ["name"]
+
+
+def test_diff_skips_normalizing_fields_missing_on_both_sides(monkeypatch) -> None:
+    calls = []
+    normalize = pull._normalize_value
+    monkeypatch.setattr(
+        pull, "_normalize_value", lambda value, kind: calls.append(value) or normalize(value, kind)
+    )
+    plan = build_diff_plan({"name": "Name", "notes": "Notes"}, {})
+
+    assert diff_planned_fields(local_row={"notes": ""}, remote_fields={}, plan=plan) == []
+    assert calls == ["", None]
@@ -1,7 +1,9 @@
 from pathlib import Path
 
+import pytest
 import yaml
 
+from crm.adapters.airtable.client import AirtableError
 from crm.adapters.airtable.mirror import AirtableMapping
 from crm.adapters.airtable.pull import pull_records
 from crm.store.migrations import load_schema
@@ -9,14 +11,24 @@ from crm.store.sqlite import SqliteStore
 
 
 class FakeClient:
-    def __init__(self) -> None:
+    def __init__(
+        self, reject_modified_field: bool = False, error_type="UNKNOWN_FIELD_NAME"
+    ) -> None:
         self.calls = []
+        self.reject_modified_field = reject_modified_field
+        self.error_type = error_type
 
-    def list_records(self, table_id, fields=None, filter_formula=None):
+    def iter_record_pages(self, table_id, fields=None, filter_formula=None):
         self.calls.append(
             {"table_id": table_id, "fields": fields, "filter_formula": filter_formula}
         )
-        return []
+        if self.reject_modified_field and "AirtableModifiedAt" in fields:
+            raise AirtableError(
+                "Unknown field name: AirtableModifiedAt",
+                status_code=422,
+                error_type=self.error_type,
+            )
+        yield []
 
 
 def _schema_path(tmp_path: Path) -> Path:
@@ -139,3 +151,50 @@ def test_pull_uses_modified_field_when_present(tmp_path: Path) -> None:
     call = client.calls[0]
     assert "AirtableModifiedAt" in call["fields"]
     assert call["filter_formula"] is not None
+
+
+def test_pull_filters_without_metadata_and_falls_back_on_unknown_field(
+    tmp_path: Path,
+) -> None:
+    schema_path = _schema_path(tmp_path)
+    schema = load_schema(schema_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    client = FakeClient(reject_modified_field=True)
+
+    pull_records(
+        store,
+        client,
+        _mapping(),
+        schema,
+        {"widgets": "tblWidgets"},
+        None,
+        last_pull_at={"widgets": "2026-01-01T00:00:00+00:00"},
+        apply=False,
+    )
+
+    first, retry = client.calls
+    assert first["filter_formula"] is not None
+    assert retry["filter_formula"] is None
+    assert "AirtableModifiedAt" not in retry["fields"]
+
+
+def test_pull_surfaces_other_validation_errors_without_metadata(tmp_path: Path) -> None:
+    schema_path = _schema_path(tmp_path)
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    client = FakeClient(reject_modified_field=True, error_type="INVALID_REQUEST_UNKNOWN")
+
+    with pytest.raises(AirtableError):
+        pull_records(
+            store,
+            client,
+            _mapping(),
+            load_schema(schema_path),
+            {"widgets": "tblWidgets"},
+            None,
+            last_pull_at={"widgets": "2026-01-01T00:00:00+00:00"},
+            apply=False,
+        )
+
+    assert len(client.calls) == 1
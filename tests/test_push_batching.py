@@ -0,0 +1,293 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+import yaml
+
+from crm.adapters.airtable import client as client_module
+from crm.adapters.airtable import mirror
+from crm.adapters.airtable.client import AirtableError, AirtableRecord
+from crm.adapters.airtable.mirror import AirtableMapping, MirrorError, push_all
+from crm.config import MirrorConfig
+from crm.services import sync
+from crm.store.sqlite import SqliteSession, SqliteStore
+
+
+class FakeClient:
+    def __init__(self, existing=None) -> None:
+        self.existing = existing or []
+        self.calls = []
+        self.updates = []
+        self.lookups = []
+        self.scans = 0
+
+    def list_records(self, table_id, fields=None, filter_formula=None):
+        self.scans += 1
+        return self.existing
+
+    def find_records_by_external_ids(self, table_id, external_ids):
+        self.lookups.append(external_ids)
+        found = {}
+        for record in self.existing:
+            external_id = record.fields.get("ExternalId")
+            if external_id in external_ids:
+                if external_id in found:
+                    raise AirtableError("Multiple Airtable records found for ExternalId.")
+                found[external_id] = record
+        return found
+
+    def update_records(self, table_id, records):
+        self.updates.append(records)
+        return list(records)
+
+    def upsert_records(self, table_id, records, merge_on):
+        self.calls.append({"table_id": table_id, "records": records, "merge_on": merge_on})
+        return [
+            AirtableRecord(record_id=f"rec{fields['ExternalId']}", fields=fields)
+            for fields in records
+        ]
+
+
+def _store(tmp_path: Path) -> SqliteStore:
+    schema = {
+        "version": 1,
+        "enums": {},
+        "tables": {
+            "widgets": {
+                "primary_key": "widget_id",
+                "fields": {
+                    "widget_id": {"type": "uuid", "required": True},
+                    "name": {"type": "text"},
+                },
+            },
+            "mirror_state": {
+                "primary_key": ["table_name", "external_id"],
+                "fields": {
+                    "table_name": {"type": "text", "required": True},
+                    "external_id": {"type": "text", "required": True},
+                    "record_id": {"type": "text"},
+                    "mirror_version": {"type": "number"},
+                    "mirror_updated_at": {"type": "datetime"},
+                },
+            },
+        },
+    }
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(yaml.safe_dump(schema, sort_keys=False), encoding="utf-8")
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(schema_path)
+    return store
+
+
+def _mapping() -> AirtableMapping:
+    return AirtableMapping(
+        mirror_fields={
+            "ExternalId": {"type": "text"},
+            "MirrorVersion": {"type": "number"},
+            "MirrorUpdatedAt": {"type": "datetime"},
+        },
+        tables={"widgets": {"fields": {"widget_id": "ExternalId", "name": "Name"}}},
+    )
+
+
+def _insert_widgets(store: SqliteStore, count: int) -> None:
+    for index in range(count):
+        store.execute(
+            "INSERT INTO widgets (widget_id, name) VALUES (?, ?)", (f"w{index}", f"Widget {index}")
+        )
+
+
+def test_push_batches_records_per_request(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 23)
+    client = FakeClient()
+
+    push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+    assert [len(call["records"]) for call in client.calls] == [10, 10, 3]
+    assert all(call["merge_on"] == ["ExternalId"] for call in client.calls)
+    row = store.fetch_one(
+        "SELECT record_id, mirror_version FROM mirror_state WHERE external_id = ?", ("w22",)
+    )
+    assert row["record_id"] == "recw22"
+    assert row["mirror_version"] == 1
+
+
+def test_push_updates_existing_records_by_id(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 3)
+    client = FakeClient(
+        existing=[
+            AirtableRecord(record_id="recExisting", fields={"ExternalId": "w1"}),
+            AirtableRecord(record_id="recOrphan", fields={}),
+        ]
+    )
+
+    push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+    assert [record.record_id for record in client.updates[0]] == ["recExisting"]
+    assert [fields["ExternalId"] for fields in client.calls[0]["records"]] == ["w0", "w2"]
+    row = store.fetch_one("SELECT record_id FROM mirror_state WHERE external_id = ?", ("w1",))
+    assert row["record_id"] == "recExisting"
+
+
+def test_push_rejects_duplicate_external_ids(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 1)
+    client = FakeClient(
+        existing=[
+            AirtableRecord(record_id="recA", fields={"ExternalId": "w0"}),
+            AirtableRecord(record_id="recB", fields={"ExternalId": "w0"}),
+        ]
+    )
+
+    with pytest.raises(MirrorError):
+        push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+
+def test_push_scans_table_when_too_many_ids_to_look_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mirror, "MAX_IDS_PER_LOOKUP", 2)
+    store = _store(tmp_path)
+    _insert_widgets(store, 3)
+    client = FakeClient(
+        existing=[AirtableRecord(record_id="recExisting", fields={"ExternalId": "w1"})]
+    )
+
+    push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+    assert (client.lookups, client.scans) == ([], 1)
+    assert [record.record_id for record in client.updates[0]] == ["recExisting"]
+
+
+def test_push_streams_rows_and_bumps_mirror_versions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mirror, "MAX_IDS_PER_LOOKUP", 2)
+    store = _store(tmp_path)
+    _insert_widgets(store, 7)
+    store.upsert_mirror_state("widgets", "w5", "recw5", 4, "2026-01-01T00:00:00+00:00")
+    client = FakeClient()
+
+    push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+    pushed = {fields["ExternalId"]: fields for call in client.calls for fields in call["records"]}
+    assert sorted(pushed) == [f"w{index}" for index in range(7)]
+    assert pushed["w5"]["MirrorVersion"] == 5
+    assert pushed["w6"]["Name"] == "Widget 6"
+    assert store.get_mirror_state("widgets", "w5")["mirror_version"] == 5
+
+
+def test_push_records_mirror_state_once_per_pushed_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 23)
+    batches = []
+    upsert_many = SqliteSession.upsert_mirror_state_many
+
+    def record(session, rows):
+        rows = list(rows)
+        batches.append(len(rows))
+        upsert_many(session, rows)
+
+    monkeypatch.setattr(SqliteSession, "upsert_mirror_state_many", record)
+    monkeypatch.setattr(
+        SqliteSession, "upsert_mirror_state", lambda *args: pytest.fail("per-row upsert")
+    )
+
+    push_all(store, FakeClient(), _mapping(), {"widgets": "tblWidgets"})
+
+    assert batches == [10, 10, 3]
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM mirror_state")["n"] == 23
+
+
+def test_mapping_precomputes_field_arrays() -> None:
+    assert _mapping().field_arrays == {"widgets": (("widget_id", "name"), ("ExternalId", "Name"))}
+
+
+def test_push_releases_its_read_connection_during_requests(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 23)
+    idle_readers = []
+
+    class ProbeClient(FakeClient):
+        def upsert_records(self, table_id, records, merge_on):
+            idle_readers.append(store._readers.qsize())
+            return super().upsert_records(table_id, records, merge_on)
+
+    push_all(store, ProbeClient(), _mapping(), {"widgets": "tblWidgets"})
+
+    assert idle_readers == [1, 1, 1]
+
+
+def test_push_failure_keeps_mirror_state_of_accepted_batches(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 23)
+
+    class FailingClient(FakeClient):
+        def upsert_records(self, table_id, records, merge_on):
+            if self.calls:
+                raise AirtableError("Airtable error 503: unavailable", status_code=503)
+            return super().upsert_records(table_id, records, merge_on)
+
+    with pytest.raises(MirrorError):
+        push_all(store, FailingClient(), _mapping(), {"widgets": "tblWidgets"})
+
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM mirror_state")["n"] == 10
+
+
+def test_push_stops_sending_after_a_record_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path)
+    _insert_widgets(store, 23)
+    stops = []
+
+    class RecordingEvent(mirror.Event):
+        def __init__(self) -> None:
+            super().__init__()
+            stops.append(self)
+
+    class SlowClient(FakeClient):
+        def upsert_records(self, table_id, records, merge_on):
+            if self.calls:
+                # Already past the stop check when the first batch fails to record.
+                assert stops[0].wait(5)
+            return super().upsert_records(table_id, records, merge_on)
+
+    upsert_many = SqliteSession.upsert_mirror_state_many
+    failures = [sqlite3.OperationalError("database is locked")]
+
+    def record(session, rows):
+        if failures:
+            raise failures.pop()
+        upsert_many(session, rows)
+
+    monkeypatch.setattr(mirror, "Event", RecordingEvent)
+    monkeypatch.setattr(SqliteSession, "upsert_mirror_state_many", record)
+    client = SlowClient()
+
+    with pytest.raises(sqlite3.OperationalError):
+        push_all(store, client, _mapping(), {"widgets": "tblWidgets"})
+
+    assert len(client.calls) == 2
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM mirror_state")["n"] == 10
+
+
+def test_sync_push_enables_the_response_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pushed = []
+    monkeypatch.setenv("AIRTABLE_API_KEY", "patTest")
+    monkeypatch.setattr(client_module, "default_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(mirror, "load_mapping", lambda path: _mapping())
+    monkeypatch.setattr(
+        mirror, "push_all", lambda store, client, *args, **kwargs: pushed.append(client)
+    )
+    mirror_config = MirrorConfig(provider="airtable", base_id="appTest", tables={})
+
+    sync.push(_store(tmp_path), mirror_config, tmp_path / "mapping.yaml", validate=False)
+
+    assert pushed[0]._response_cache_ttl == client_module.RESPONSE_CACHE_TTL_SECONDS
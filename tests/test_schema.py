@@ -1,15 +1,112 @@
+import os
+import sqlite3
 from pathlib import Path
 
+import pytest
+
+from crm.store import migrations
+from crm.store.migrations import load_schema, read_yaml
 from crm.store.sqlite import SqliteStore
 
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
 
 def test_apply_schema_creates_tables(tmp_path: Path) -> None:
     db_path = tmp_path / "test.sqlite"
     store = SqliteStore(db_path)
-    schema_path = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
-    store.apply_schema(schema_path)
+    store.apply_schema(SCHEMA_PATH)
 
     row = store.fetch_one(
         "SELECT name FROM sqlite_master WHERE type='table' AND name='organizations'"
     )
     assert row is not None
+
+
+def test_read_yaml_uses_hash_keyed_sidecar(tmp_path: Path) -> None:
+    path = tmp_path / "doc.yaml"
+    path.write_text("tables:\n  widgets: {}\n", encoding="utf-8")
+    sidecar = tmp_path / "doc.yaml.cache.json"
+
+    assert read_yaml(path) == {"tables": {"widgets": {}}}
+    assert sidecar.exists()
+    sidecar.write_text(sidecar.read_text().replace("widgets", "cached"), encoding="utf-8")
+    assert read_yaml(path) == {"tables": {"cached": {}}}
+
+    path.write_text("tables:\n  gadgets: {}\n", encoding="utf-8")
+    assert read_yaml(path) == {"tables": {"gadgets": {}}}
+
+
+def test_apply_schema_creates_partial_covering_indexes(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(SCHEMA_PATH)
+
+    row = store.fetch_one(
+        "SELECT sql FROM sqlite_master WHERE type='index' AND name = ?",
+        ("idx_sponsor_opps_next_action_due_next_action_org_id_opp_id",),
+    )
+    assert row is not None
+    assert row["sql"].endswith("WHERE next_action_due IS NOT NULL")
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (
+            "SELECT table_name, record_id FROM mirror_state WHERE external_id = ? LIMIT 2",
+            "idx_mirror_state_external_id",
+        ),
+        ("SELECT touch_id FROM touches WHERE opp_id = ?", "idx_touches_opp_id"),
+        ("SELECT touch_id FROM touches WHERE member_id = ?", "idx_touches_member_id"),
+        ("SELECT task_id FROM tasks WHERE opp_id = ?", "idx_tasks_opp_id"),
+    ],
+)
+def test_lookups_use_indexes(tmp_path: Path, query: str, index: str) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.apply_schema(SCHEMA_PATH)
+
+    plan = store.fetch_all(f"EXPLAIN QUERY PLAN {query}", ("w1",))
+    assert any(index in row["detail"] for row in plan)
+
+
+def test_load_schema_is_memoized_until_the_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "schema.yaml"
+    path.write_text("tables:\n  widgets: {}\n", encoding="utf-8")
+    first = load_schema(path)
+    assert load_schema(path) is first
+
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text("tables:\n  gadgets: {}\n  widgets: {}\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert list(load_schema(path).tables) == ["gadgets", "widgets"]
+
+
+def test_apply_schema_reuses_generated_ddl(tmp_path: Path, monkeypatch) -> None:
+    SqliteStore(tmp_path / "first.sqlite").apply_schema(SCHEMA_PATH)
+    monkeypatch.setattr(migrations, "_table_sql", lambda *args: pytest.fail("regenerated DDL"))
+
+    store = SqliteStore(tmp_path / "second.sqlite")
+    store.apply_schema(SCHEMA_PATH)
+
+    assert store.fetch_one("SELECT name FROM sqlite_master WHERE name = 'touches'") is not None
+
+
+def test_apply_schema_is_all_or_nothing(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(
+        "tables:\n"
+        "  widgets:\n"
+        "    primary_key: widget_id\n"
+        "    fields:\n"
+        "      widget_id: { type: uuid }\n"
+        "    indexes:\n"
+        "      - [missing_column]\n",
+        encoding="utf-8",
+    )
+    store = SqliteStore(tmp_path / "test.sqlite")
+
+    with pytest.raises(sqlite3.OperationalError):
+        store.apply_schema(schema_path)
+
+    assert store.fetch_one("SELECT name FROM sqlite_master WHERE name = 'widgets'") is None
+    with store.session(immediate=True) as session:
+        session.execute("CREATE TABLE gadgets (gadget_id TEXT)")
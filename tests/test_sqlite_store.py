@@ -0,0 +1,178 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from crm.store.sqlite import SqliteStore, StoreError, close_stores, get_store
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
+
+def test_connections_use_wal_and_immediate_write_sessions(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+
+    with store.connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    with store.connect(immediate=True) as conn:
+        assert conn.in_transaction
+
+
+def test_reads_use_pooled_read_only_connections(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (name TEXT)")
+
+    with store.read() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO widgets VALUES ('a')")
+    with store.read() as again:
+        assert again is conn
+
+    store.execute("INSERT INTO widgets VALUES ('b')")
+    assert store.fetch_one("SELECT name FROM widgets")["name"] == "b"
+    store.close()
+
+
+def test_iter_rows_yields_plain_tuples(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT, name TEXT)")
+    store.execute("INSERT INTO widgets VALUES ('w1', 'Widget')")
+
+    with store.iter_rows("SELECT * FROM widgets") as cur:
+        assert [column[0] for column in cur.description] == ["widget_id", "name"]
+        assert list(cur) == [("w1", "Widget")]
+    assert isinstance(store.fetch_one("SELECT * FROM widgets"), sqlite3.Row)
+
+
+def test_backup_to_writes_a_consistent_copy(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT)")
+    store.execute("INSERT INTO widgets VALUES ('w1')")
+    dest = tmp_path / "snap.sqlite"
+    dest.write_bytes(b"stale")
+
+    store.backup_to(dest)
+
+    assert SqliteStore(dest).fetch_one("SELECT widget_id FROM widgets")["widget_id"] == "w1"
+
+
+def test_get_store_reuses_one_store_per_database(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    store = get_store(Path("test.sqlite"))
+
+    assert get_store(tmp_path / "test.sqlite") is store
+    assert get_store(tmp_path / "other.sqlite") is not store
+    store.execute("CREATE TABLE widgets (name TEXT)")
+    store.fetch_all("SELECT name FROM widgets")
+
+    close_stores()
+
+    assert store._writer is None
+    assert store._readers.empty()
+    assert get_store(tmp_path / "test.sqlite") is not store
+    close_stores()
+
+
+def test_write_sessions_reuse_one_connection(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+
+    with store.connect() as first, store.connect() as nested:
+        assert nested is not first
+    with store.connect() as second:
+        assert second is first
+    assert not first.in_transaction
+    store.close()
+    with store.connect() as reopened:
+        assert reopened is not first
+
+
+def test_upsert_mirror_state_many_spans_multi_row_batches(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute(
+        "CREATE TABLE mirror_state (table_name TEXT, external_id TEXT, record_id TEXT, "
+        "mirror_version REAL, mirror_updated_at TEXT, PRIMARY KEY (table_name, external_id))"
+    )
+    rows = [("widgets", f"w{index}", f"rec{index}", 1, "2026-01-01") for index in range(250)]
+
+    with store.session() as session:
+        session.upsert_mirror_state_many(rows)
+        session.upsert_mirror_state_many([("widgets", "w7", "recNew", 2, "2026-01-02")])
+
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM mirror_state")["n"] == 250
+    assert tuple(store.get_mirror_state("widgets", "w7"))[2:] == ("recNew", 2, "2026-01-02")
+
+
+def test_bulk_load_rebuilds_secondary_indexes(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT PRIMARY KEY, name TEXT)")
+    store.execute("CREATE INDEX idx_widgets_name ON widgets (name)")
+    index_sql = "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx%'"
+
+    with store.bulk_load() as session:
+        assert session.fetch_all(index_sql) == []
+        session.executemany(
+            "INSERT INTO widgets VALUES (?, ?)", [(f"w{index}", "Gear") for index in range(50)]
+        )
+    with pytest.raises(sqlite3.IntegrityError), store.bulk_load() as session:
+        session.execute("INSERT INTO widgets VALUES ('w0', 'Dup')")
+
+    assert [row["name"] for row in store.fetch_all(index_sql)] == ["idx_widgets_name"]
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 50
+
+
+def test_write_sessions_roll_back_as_a_whole(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT PRIMARY KEY)")
+
+    with pytest.raises(sqlite3.IntegrityError), store.session() as session:
+        session.execute("INSERT INTO widgets VALUES ('w1')")
+        session.execute("INSERT INTO widgets VALUES ('w1')")
+
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 0
+
+
+def test_transaction_reads_its_own_writes(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT PRIMARY KEY)")
+
+    with store.transaction() as session:
+        session.execute("INSERT INTO widgets VALUES ('w1')")
+        assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 1
+        with store.iter_rows("SELECT widget_id FROM widgets") as cur:
+            assert cur.fetchall() == [("w1",)]
+        with pytest.raises(StoreError):
+            store.backup_to(tmp_path / "snap.sqlite")
+
+
+def test_reads_create_a_missing_database(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "new.sqlite")
+
+    assert store.fetch_all("SELECT name FROM sqlite_master") == []
+    assert (tmp_path / "new.sqlite").exists()
+
+
+def test_nested_transactions_join_the_outer_one(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT PRIMARY KEY)")
+
+    with pytest.raises(RuntimeError), store.transaction():
+        with store.transaction():
+            store.execute("INSERT INTO widgets VALUES ('w1')")
+        store.execute("INSERT INTO widgets VALUES ('w2')")
+        assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 2
+        raise RuntimeError("abort")
+
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 0
+
+
+def test_transaction_on_a_fallback_connection_keeps_its_writes(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "test.sqlite")
+    store.execute("CREATE TABLE widgets (widget_id TEXT PRIMARY KEY)")
+
+    with pytest.raises(RuntimeError), store.connect(), store.transaction() as session:
+        # The writer is busy, so transaction() runs on a short-lived connection.
+        store.execute("INSERT INTO widgets VALUES ('w1')")
+        assert session.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 1
+        raise RuntimeError("abort")
+
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM widgets")["n"] == 0
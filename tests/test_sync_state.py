@@ -0,0 +1,16 @@
+import json
+from pathlib import Path
+
+from crm.services.sync_state import SyncState, load_sync_state, save_sync_state
+
+
+def test_sync_state_round_trips_and_coerces_values(tmp_path: Path) -> None:
+    state = SyncState(last_pull_at={"widgets": "2026-01-01T00:00:00+00:00"}, last_push_at=None)
+    save_sync_state(tmp_path, state)
+    assert load_sync_state(tmp_path) == state
+
+    (tmp_path / ".sync_state.json").write_text(
+        json.dumps({"last_pull_at": {"widgets": 1}, "last_push_at": 2, "schema_fingerprint": ""}),
+        encoding="utf-8",
+    )
+    assert load_sync_state(tmp_path) == SyncState(last_pull_at={"widgets": "1"}, last_push_at="2")
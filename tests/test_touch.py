@@ -1,15 +1,18 @@
 from datetime import date
 from pathlib import Path
 
+import pytest
+
 from crm.services import leads, touch
 from crm.store.sqlite import SqliteStore
 
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
+
 
 def _store(tmp_path: Path) -> SqliteStore:
     db_path = tmp_path / "test.sqlite"
     store = SqliteStore(db_path)
-    schema_path = Path(__file__).resolve().parents[1] / "resources" / "schema" / "canonical.yaml"
-    store.apply_schema(schema_path)
+    store.apply_schema(SCHEMA_PATH)
     return store
 
 
@@ -43,3 +46,120 @@ def test_touch_does_not_clear_next_action(tmp_path: Path) -> None:
     )
     assert row["next_action"] == "Send deck"
     assert row["next_action_due"] == "2026-01-20"
+
+
+def test_touch_links_lead_and_rejects_unknown_ids(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    opp_id = leads.add_sponsor_lead(
+        store,
+        org_name="Acme Bio",
+        domain="acmebio.com",
+        contact="Jane Doe <jane@acmebio.com>",
+        stage="contacted",
+        value=None,
+        tier=None,
+        next_action=None,
+        due=None,
+        notes=None,
+    )
+    touch_id = touch.log_touch(
+        store,
+        record_id=opp_id,
+        channel="email",
+        direction="outbound",
+        subject=None,
+        note="Left a message",
+        next_action="Follow up",
+        due=None,
+    )
+    row = store.fetch_one(
+        "SELECT t.opp_id, t.member_id, t.org_id = o.org_id AS same_org, "
+        "t.person_id = o.primary_person_id AS same_person, o.next_action, o.last_touch_channel "
+        "FROM touches t JOIN sponsor_opps o ON o.opp_id = t.opp_id WHERE t.touch_id = ?",
+        (touch_id,),
+    )
+    assert (row["opp_id"], row["member_id"]) == (opp_id, None)
+    assert row["same_org"] and row["same_person"]
+    assert (row["next_action"], row["last_touch_channel"]) == ("Follow up", "email")
+
+    with pytest.raises(touch.TouchError):
+        touch.log_touch(store, "missing", "email", "outbound", None, None, None, None)
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM touches")["n"] == 1
+
+
+def test_touch_runs_in_one_immediate_session(tmp_path: Path, monkeypatch) -> None:
+    store = _store(tmp_path)
+    opp_id = leads.add_sponsor_lead(
+        store,
+        org_name="Acme Bio",
+        domain=None,
+        contact=None,
+        stage="contacted",
+        value=None,
+        tier=None,
+        next_action=None,
+        due=None,
+        notes=None,
+    )
+    sessions = []
+    open_session = store.session
+
+    def record(immediate=False):
+        sessions.append(immediate)
+        return open_session(immediate=immediate)
+
+    monkeypatch.setattr(store, "session", record)
+    monkeypatch.setattr(store, "fetch_one", lambda *args: pytest.fail("read outside session"))
+
+    touch.log_touch(store, opp_id, "email", "outbound", None, None, "Follow up", None)
+
+    assert sessions == [True]
+
+
+def test_touch_resolves_campaign_members(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    member_id = leads.add_attendee_lead(
+        store,
+        campaign_name="Spring Summit",
+        person="Jane Doe <jane@acmebio.com>",
+        status="invited",
+        segment=None,
+        next_action=None,
+        due=None,
+        notes=None,
+    )
+
+    touch.log_touch(store, member_id, "email", "outbound", None, None, None, date(2026, 2, 1))
+
+    row = store.fetch_one(
+        "SELECT t.opp_id, t.member_id, t.person_id = m.person_id AS same_person, "
+        "m.next_action_due FROM touches t JOIN campaign_members m USING (member_id)"
+    )
+    assert (row["opp_id"], row["member_id"], row["same_person"]) == (None, member_id, 1)
+    assert row["next_action_due"] == "2026-02-01"
+
+
+def test_store_transaction_groups_service_calls(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    with store.transaction():
+        opp_id = leads.add_sponsor_lead(
+            store,
+            org_name="Acme Bio",
+            domain=None,
+            contact=None,
+            stage="contacted",
+            value=None,
+            tier=None,
+            next_action=None,
+            due=None,
+            notes=None,
+        )
+        touch.log_touch(store, opp_id, "email", "outbound", None, None, None, None)
+        assert store.fetch_one("SELECT COUNT(*) AS n FROM touches")["n"] == 1
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM touches")["n"] == 1
+
+    with pytest.raises(touch.TouchError), store.transaction():
+        touch.log_touch(store, opp_id, "email", "outbound", None, None, None, None)
+        touch.log_touch(store, "missing", "email", "outbound", None, None, None, None)
+    assert store.fetch_one("SELECT COUNT(*) AS n FROM touches")["n"] == 1